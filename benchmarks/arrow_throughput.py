@@ -0,0 +1,87 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Measures conversion throughput between Entry models and Arrow/Parquet.
+
+    python benchmarks/arrow_throughput.py [entries] [batch_size]
+"""
+
+import io
+import sys
+import time
+from datetime import datetime, timezone
+
+from marshmallow_har import arrow
+from marshmallow_har.model import Content, Entry, Header, Param, Request, Response, Timings
+
+
+def make_entries(count):
+    started = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        yield Entry(
+            pageref="page_%d" % (i // 100),
+            started_date_time=started,
+            time=i % 1000,
+            request=Request(method="GET",
+                            url="http://example.com/item/%d?page=%d" % (i, i % 10),
+                            headers=[Header(name="Host", value="example.com"),
+                                     Header(name="Accept", value="*/*")],
+                            query_string=[Param(name="page", value=str(i % 10))]),
+            response=Response(status=200 if i % 10 else 404,
+                              status_text="OK",
+                              headers=[Header(name="Content-Type", value="text/html")],
+                              content=Content(size=512, mime_type="text/html", text="x" * 512)),
+            timings=Timings(blocked=1, dns=2, connect=3, send=4, wait=5, receive=6),
+        )
+
+
+def measure(label, count, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print("%-24s %8.3fs %12.0f entries/s" % (label, elapsed, count / elapsed))
+    return result
+
+
+def main(count=10000, batch_size=5000):
+    entries = list(make_entries(count))
+
+    batches = measure("to record batches", count,
+                      lambda: list(arrow.record_batches(entries, batch_size=batch_size)))
+    measure("from record batches", count, lambda: sum(1 for _ in arrow.read_entries(batches)))
+
+    out = io.BytesIO()
+    measure("write parquet", count, lambda: arrow.write_parquet(entries, out, batch_size=batch_size))
+    print("%-24s %8.1f bytes/entry" % ("parquet size", len(out.getvalue()) / count))
+
+    out.seek(0)
+    measure("read parquet", count, lambda: sum(1 for _ in arrow.read_parquet(out, batch_size=batch_size)))
+
+    out.seek(0)
+    measure("read parquet (no body)", count,
+            lambda: sum(1 for _ in arrow.read_parquet(out, batch_size=batch_size, include_body=False)))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,102 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Compares sequential and parallel dumping of a large log.
+
+    python benchmarks/parallel_dump.py [entries] [chunk_size]
+
+Workers go up to the number of CPUs, so scaling has to be measured on a
+multi-core machine. The only results recorded so far come from a single core
+(CPython 3.11, GIL enabled, 5000 entries, chunk_size 500), where no parallel
+speed-up is possible:
+
+    sequential                  1.634s         3060 entries/s
+    thread x1                   1.109s         4510 entries/s
+    process x1                  1.655s         3021 entries/s
+
+With a single worker nothing runs concurrently, so the difference between
+the thread run and sequential is not a parallel speed-up.
+"""
+
+import io
+import json
+import os
+import pickle
+import sys
+import time
+
+from marshmallow_har.model import Content, Entry, HAR, Header, Request, Response, Timings
+from marshmallow_har.parallel import dump_parallel
+from marshmallow_har.schema import HARSchema
+
+
+def make_har(count):
+    # Building models through their constructor is slow, copy a template
+    # instead. Entries must be distinct objects, otherwise pickle sends a
+    # single copy per chunk to worker processes.
+    template = Entry(request=Request(method="GET",
+                                     url="http://example.com/item?page=1",
+                                     headers=[Header(name="Host", value="example.com")]),
+                     response=Response(status=200,
+                                       status_text="OK",
+                                       headers=[Header(name="Content-Type", value="text/html")],
+                                       content=Content(size=512, mime_type="text/html", text="x" * 512)),
+                     timings=Timings(wait=5, receive=6))
+    template = pickle.dumps(template)
+
+    entries = []
+    for i in range(count):
+        entry = pickle.loads(template)
+        entry.request.url = "http://example.com/item/%d?page=%d" % (i, i % 10)
+        entry.time = i % 1000
+        entries.append(entry)
+
+    return HAR(version="1.2", entries=entries)
+
+
+def measure(label, count, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print("%-24s %8.3fs %12.0f entries/s" % (label, elapsed, count / elapsed))
+    return elapsed
+
+
+def main(count=50000, chunk_size=1000):
+    har = make_har(count)
+
+    baseline = measure("sequential", count, lambda: json.dump(HARSchema().dump(har), io.StringIO()))
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        for executor in ("thread", "process"):
+            elapsed = measure("%s x%d" % (executor, workers), count,
+                              lambda: dump_parallel(har, io.StringIO(), executor=executor,
+                                                    workers=workers, chunk_size=chunk_size))
+            print("%-24s %8.2fx" % ("", baseline / elapsed))
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -25,11 +25,14 @@ from .model import PostParam, PostData, Param, Request, Response, Creator
 from .model import PageTimings, Page, Browser, Entry, Log
 
 from .schema import HARSchema
+from .stream import HARReader, HARWriter
 
 
 __all__ = [
     'HAR',
     'HARSchema',
+    'HARReader',
+    'HARWriter',
     'Cookie',
     'CacheState',
     'Cache',
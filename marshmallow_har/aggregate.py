@@ -0,0 +1,164 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import Counter, OrderedDict
+from datetime import timedelta
+
+from .model import Timings
+from .schema import PageSchema
+from .stream import HARReader
+
+
+def _milliseconds(delta):
+    return delta.total_seconds() * 1000
+
+
+class PageSummary:
+    """
+    Totals over the entries of a page. Sizes and timing phases reported as -1
+    (unknown) are left out of the sums.
+    """
+
+    def __init__(self, pageref, page=None):
+        self.pageref = pageref
+        self.page = page
+        self.entry_count = 0
+        self.body_size = 0
+        self.content_size = 0
+        self.timings = OrderedDict((phase, 0) for phase in Timings.phases)
+        self.status_counts = Counter()
+        self.mime_type_counts = Counter()
+        self.first_start = None
+        self.last_end = None
+
+    def add(self, entry):
+        self.entry_count += 1
+
+        response = entry.response
+        if response is not None:
+            self.status_counts[response.status] += 1
+
+            if response.body_size > 0:
+                self.body_size += response.body_size
+
+            content = response.content
+            if content is not None:
+                if content.size > 0:
+                    self.content_size += content.size
+                if content.mime_type:
+                    self.mime_type_counts[content.mime_type.split(";")[0].strip().lower()] += 1
+
+        if entry.timings is not None:
+            for phase in Timings.phases:
+                value = getattr(entry.timings, phase)
+                if value > 0:
+                    self.timings[phase] += value
+
+        start = entry.started_date_time
+        if start is not None:
+            end = start + timedelta(milliseconds=max(entry.time, 0))
+
+            if self.first_start is None or start < self.first_start:
+                self.first_start = start
+            if self.last_end is None or end > self.last_end:
+                self.last_end = end
+
+    @property
+    def duration(self):
+        if self.first_start is None:
+            return None
+        return _milliseconds(self.last_end - self.first_start)
+
+    @property
+    def start_offset(self):
+        """
+        Milliseconds between the start of the page and its first request.
+        """
+        if self.first_start is None or self.page is None or self.page.started_date_time is None:
+            return None
+        return _milliseconds(self.first_start - self.page.started_date_time)
+
+    @property
+    def end_offset(self):
+        """
+        Milliseconds between the start of the page and the end of its last
+        request.
+        """
+        if self.last_end is None or self.page is None or self.page.started_date_time is None:
+            return None
+        return _milliseconds(self.last_end - self.page.started_date_time)
+
+    @property
+    def on_load_delta(self):
+        """
+        Milliseconds between the page's onLoad timing and the end of its last
+        request, negative when requests finished before onLoad.
+        """
+        end_offset = self.end_offset
+        page_timings = self.page.page_timings if self.page is not None else None
+        if end_offset is None or page_timings is None or page_timings.on_load < 0:
+            return None
+        return end_offset - page_timings.on_load
+
+    def __repr__(self):
+        return "%s(%r, entry_count=%d)" % (self.__class__.__name__, self.pageref, self.entry_count)
+
+
+def summarize_entries(entries, pages=None):
+    """
+    Groups entries by pageref in a single pass. Returns an ordered mapping of
+    pageref to `PageSummary`, entries without a page being grouped under
+    None.
+    """
+    summaries = OrderedDict()
+    for page in pages or []:
+        summaries[page.id] = PageSummary(page.id, page)
+
+    for entry in entries:
+        summary = summaries.get(entry.pageref)
+        if summary is None:
+            summary = summaries[entry.pageref] = PageSummary(entry.pageref)
+        summary.add(entry)
+
+    return summaries
+
+
+def summarize_log(log):
+    return summarize_entries(log.entries, log.pages)
+
+
+def summarize_file(fp, chunk_size=65536):
+    """
+    Same as `summarize_log`, streaming the entries of a HAR file. Pages are
+    matched with their summaries once the whole file is read.
+    """
+    reader = HARReader(fp, chunk_size=chunk_size)
+    by_pageref = summarize_entries(reader)
+
+    summaries = OrderedDict()
+    for page in PageSchema(many=True).load(reader.log_fields.get("pages") or []):
+        summary = summaries[page.id] = by_pageref.pop(page.id, None) or PageSummary(page.id)
+        summary.page = page
+
+    summaries.update(by_pageref)
+    return summaries
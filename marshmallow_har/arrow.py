@@ -0,0 +1,300 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from datetime import timedelta, timezone
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    raise ImportError("marshmallow_har.arrow requires pyarrow, install marshmallow-har[arrow]")
+
+from .model import Content, Cookie, Entry, Header, Param, PostData, PostParam, Request, Response, Timings
+
+
+_STRING = pa.dictionary(pa.int32(), pa.string())
+_TIMESTAMP = pa.timestamp("us", tz="UTC")
+# Seconds east of UTC of the original datetime, null when it was naive.
+_OFFSET = pa.int32()
+
+_NAME_VALUE = pa.list_(pa.struct([("name", pa.string()), ("value", pa.string())]))
+_COOKIES = pa.list_(pa.struct([
+    ("name", pa.string()),
+    ("value", pa.string()),
+    ("path", pa.string()),
+    ("domain", pa.string()),
+    ("expires", _TIMESTAMP),
+    ("expires_offset", _OFFSET),
+    ("http_only", pa.bool_()),
+    ("secure", pa.bool_()),
+]))
+_POST_PARAMS = pa.list_(pa.struct([
+    ("name", pa.string()),
+    ("value", pa.string()),
+    ("file_name", pa.string()),
+    ("content_type", pa.string()),
+]))
+
+_COLUMNS = [
+    ("pageref", _STRING),
+    ("started_date_time", _TIMESTAMP),
+    ("started_date_time_offset", _OFFSET),
+    ("time", pa.int64()),
+    ("server_ip_address", _STRING),
+    ("connection", pa.string()),
+    ("request_method", _STRING),
+    ("request_url", pa.string()),
+    ("request_http_version", _STRING),
+    ("request_cookies", _COOKIES),
+    ("request_headers", _NAME_VALUE),
+    ("request_query_string", _NAME_VALUE),
+    ("request_post_mime_type", _STRING),
+    ("request_post_params", _POST_PARAMS),
+    ("request_post_text", pa.string()),
+    ("request_header_size", pa.int64()),
+    ("request_body_size", pa.int64()),
+    ("response_status", pa.int32()),
+    ("response_status_text", _STRING),
+    ("response_http_version", _STRING),
+    ("response_cookies", _COOKIES),
+    ("response_headers", _NAME_VALUE),
+    ("response_redirect_url", pa.string()),
+    ("response_header_size", pa.int64()),
+    ("response_body_size", pa.int64()),
+    ("response_content_size", pa.int64()),
+    ("response_content_mime_type", _STRING),
+    ("response_content_encoding", _STRING),
+    ("response_content_text", pa.string()),
+] + [("timings_%s" % phase, pa.int64()) for phase in Timings.phases]
+
+BODY_COLUMN = "response_content_text"
+
+
+def arrow_schema(include_body=True):
+    return pa.schema([pa.field(name, type) for name, type in _COLUMNS
+                      if include_body or name != BODY_COLUMN])
+
+
+def _name_values(items):
+    return [{"name": item.name, "value": item.value} for item in items]
+
+
+def _utc_offset(value):
+    if value is None or value.tzinfo is None:
+        return None
+    return int(value.utcoffset().total_seconds())
+
+
+def _local_time(value, offset):
+    if value is None:
+        return None
+    if offset is None:
+        return value.replace(tzinfo=None)
+    return value.astimezone(timezone(timedelta(seconds=offset)))
+
+
+def _cookies(cookies):
+    return [{"name": cookie.name,
+             "value": cookie.value,
+             "path": cookie.path,
+             "domain": cookie.domain,
+             "expires": cookie.expires,
+             "expires_offset": _utc_offset(cookie.expires),
+             "http_only": cookie.http_only,
+             "secure": cookie.secure} for cookie in cookies]
+
+
+def _post_params(params):
+    return [{"name": param.name,
+             "value": param.value,
+             "file_name": param.file_name,
+             "content_type": param.content_type} for param in params]
+
+
+def _row(entry):
+    request, response, timings = entry.request, entry.response, entry.timings
+    row = {
+        "pageref": entry.pageref,
+        "started_date_time": entry.started_date_time,
+        "started_date_time_offset": _utc_offset(entry.started_date_time),
+        "time": entry.time,
+        "server_ip_address": entry.server_ip_address,
+        "connection": entry.connection,
+    }
+
+    if request is not None:
+        post_data = request.post_data
+        row.update({
+            "request_method": request.method,
+            "request_url": request.url,
+            "request_http_version": request.http_version,
+            "request_cookies": _cookies(request.cookies),
+            "request_headers": _name_values(request.headers),
+            "request_query_string": _name_values(request.query_string),
+            "request_post_mime_type": post_data.mime_type,
+            "request_post_params": _post_params(post_data.params),
+            "request_post_text": post_data.text,
+            "request_header_size": request.header_size,
+            "request_body_size": request.body_size,
+        })
+
+    if response is not None:
+        content = response.content
+        row.update({
+            "response_status": response.status,
+            "response_status_text": response.status_text,
+            "response_http_version": response.http_version,
+            "response_cookies": _cookies(response.cookies),
+            "response_headers": _name_values(response.headers),
+            "response_redirect_url": response.redirect_url,
+            "response_header_size": response.header_size,
+            "response_body_size": response.body_size,
+        })
+
+        if content is not None:
+            row.update({
+                "response_content_size": content.size,
+                "response_content_mime_type": content.mime_type,
+                "response_content_encoding": content.encoding,
+                "response_content_text": content.text,
+            })
+
+    if timings is not None:
+        for phase in Timings.phases:
+            row["timings_%s" % phase] = getattr(timings, phase)
+
+    return row
+
+
+def _to_batch(rows, schema):
+    arrays = [pa.array([row.get(field.name) for row in rows], type=field.type) for field in schema]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def record_batches(entries, batch_size=10000, include_body=True):
+    """
+    Converts entries to Arrow record batches of at most `batch_size` rows,
+    consuming the iterable lazily.
+
+    Timestamps are stored in UTC along with their original offset in a
+    separate `*_offset` column, so naive and non-UTC datetimes read back as
+    they were written. Extended attributes, comments and cache information
+    are not converted.
+    """
+    schema = arrow_schema(include_body)
+    rows = []
+
+    for entry in entries:
+        rows.append(_row(entry))
+        if len(rows) >= batch_size:
+            yield _to_batch(rows, schema)
+            rows = []
+
+    if rows:
+        yield _to_batch(rows, schema)
+
+
+def write_parquet(entries, where, batch_size=10000, include_body=True, **kwargs):
+    """
+    Writes entries to a Parquet file, one row group per batch. Extra keyword
+    arguments are passed to `pyarrow.parquet.ParquetWriter`.
+    """
+    with pq.ParquetWriter(where, arrow_schema(include_body), **kwargs) as writer:
+        for batch in record_batches(entries, batch_size=batch_size, include_body=include_body):
+            writer.write_batch(batch)
+
+
+def _cookie(data):
+    offset = data.pop("expires_offset")
+    return Cookie(expires=_local_time(data.pop("expires"), offset), **data)
+
+
+def _entry(row):
+    request = None
+    if row["request_method"] is not None:
+        request = Request(
+            method=row["request_method"],
+            url=row["request_url"],
+            http_version=row["request_http_version"],
+            cookies=[_cookie(cookie) for cookie in row["request_cookies"] or []],
+            headers=[Header(**header) for header in row["request_headers"] or []],
+            query_string=[Param(**param) for param in row["request_query_string"] or []],
+            post_data=PostData(mime_type=row["request_post_mime_type"],
+                               params=[PostParam(**param) for param in row["request_post_params"] or []],
+                               text=row["request_post_text"]),
+            header_size=row["request_header_size"],
+            body_size=row["request_body_size"],
+        )
+
+    response = None
+    if row["response_status"] is not None:
+        content = None
+        if row["response_content_size"] is not None:
+            content = Content(size=row["response_content_size"],
+                              mime_type=row["response_content_mime_type"],
+                              text=row.get(BODY_COLUMN) or "",
+                              encoding=row["response_content_encoding"])
+
+        response = Response(
+            status=row["response_status"],
+            status_text=row["response_status_text"],
+            http_version=row["response_http_version"],
+            cookies=[_cookie(cookie) for cookie in row["response_cookies"] or []],
+            headers=[Header(**header) for header in row["response_headers"] or []],
+            content=content,
+            redirect_url=row["response_redirect_url"],
+            header_size=row["response_header_size"],
+            body_size=row["response_body_size"],
+        )
+
+    timings = None
+    if row["timings_wait"] is not None:
+        timings = Timings(**{phase: row["timings_%s" % phase] for phase in Timings.phases})
+
+    return Entry(pageref=row["pageref"],
+                 started_date_time=_local_time(row["started_date_time"], row["started_date_time_offset"]),
+                 time=row["time"],
+                 request=request,
+                 response=response,
+                 timings=timings,
+                 server_ip_address=row["server_ip_address"],
+                 connection=row["connection"])
+
+
+def read_entries(batches):
+    """
+    Reconstructs `Entry` models from record batches or tables produced by
+    `record_batches`.
+    """
+    if isinstance(batches, pa.Table):
+        batches = batches.to_batches()
+
+    for batch in batches:
+        for row in batch.to_pylist():
+            yield _entry(row)
+
+
+def read_parquet(source, batch_size=10000, include_body=True):
+    parquet_file = pq.ParquetFile(source)
+    columns = [name for name in parquet_file.schema_arrow.names if include_body or name != BODY_COLUMN]
+    return read_entries(parquet_file.iter_batches(batch_size=batch_size, columns=columns))
@@ -0,0 +1,231 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import base64
+import codecs
+import threading
+import zlib
+from collections import OrderedDict
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+class _Deflate:
+    # Servers send "deflate" both zlib-wrapped and raw, look at the header to tell.
+
+    def __init__(self):
+        self._decompressor = None
+
+    def decompress(self, data):
+        if self._decompressor is None:
+            if not data:
+                return b""
+            zlib_wrapped = len(data) > 1 and data[0] & 0x0f == 8 and (data[0] << 8 | data[1]) % 31 == 0
+            self._decompressor = zlib.decompressobj(zlib.MAX_WBITS if zlib_wrapped else -zlib.MAX_WBITS)
+
+        return self._decompressor.decompress(data)
+
+    def flush(self):
+        return self._decompressor.flush() if self._decompressor is not None else b""
+
+
+class _Brotli:
+
+    def __init__(self):
+        if brotli is None:
+            raise ValueError("Decoding brotli bodies requires the brotli package")
+        self._decompressor = brotli.Decompressor()
+
+    def decompress(self, data):
+        return self._decompressor.process(data)
+
+    def flush(self):
+        return b""
+
+
+_DECODERS = {
+    "gzip": lambda: zlib.decompressobj(16 + zlib.MAX_WBITS),
+    "x-gzip": lambda: zlib.decompressobj(16 + zlib.MAX_WBITS),
+    "deflate": _Deflate,
+    "br": _Brotli,
+}
+
+
+def _decoders(content_encoding):
+    decoders = []
+    for coding in reversed((content_encoding or "").split(",")):
+        coding = coding.strip().lower()
+        if coding in ("", "identity"):
+            continue
+        if coding not in _DECODERS:
+            raise ValueError("Unsupported content encoding: %s" % coding)
+        decoders.append(_DECODERS[coding]())
+
+    return decoders
+
+
+def _raw_chunks(content, chunk_size):
+    text = content.text or ""
+
+    if content.encoding == "base64":
+        if "\n" in text or "\r" in text or " " in text:
+            text = "".join(text.split())
+
+        step = max(chunk_size // 3 * 4, 4)
+        for start in range(0, len(text), step):
+            yield base64.b64decode(text[start:start + step])
+
+    elif content.encoding is None:
+        for start in range(0, len(text), chunk_size):
+            yield text[start:start + chunk_size].encode("utf-8")
+
+    else:
+        raise ValueError("Unsupported content text encoding: %s" % content.encoding)
+
+
+def iter_bytes(content, content_encoding=None, chunk_size=65536):
+    """
+    Yields the body of `content` in chunks, decoding base64 text and the
+    codings listed in `content_encoding` as it goes.
+    """
+    decoders = _decoders(content_encoding)
+
+    for chunk in _raw_chunks(content, chunk_size):
+        for decoder in decoders:
+            chunk = decoder.decompress(chunk)
+        if chunk:
+            yield chunk
+
+    tail = b""
+    for decoder in decoders:
+        tail = decoder.decompress(tail) + decoder.flush()
+    if tail:
+        yield tail
+
+
+class BodyCache:
+    """
+    Least recently used cache of decoded bodies, one per `Content` object,
+    bounded by the total size of the cached bodies.
+
+    Items keep a reference to the text they were decoded from and are ignored
+    once the content's text or encodings change. That text counts toward the
+    size of the cache along with the decoded body.
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, content, content_encoding):
+        with self._lock:
+            item = self._items.get(id(content))
+            if item is None:
+                return None
+
+            text, encoding, cached_encoding, data, _ = item
+            if text is not content.text or encoding != content.encoding or cached_encoding != content_encoding:
+                return None
+
+            self._items.move_to_end(id(content))
+            return data
+
+    def put(self, content, content_encoding, data):
+        with self._lock:
+            previous = self._items.pop(id(content), None)
+            if previous is not None:
+                self.size -= previous[4]
+
+            size = len(data) + len(content.text or "")
+            if size > self.max_bytes:
+                return
+
+            self._items[id(content)] = (content.text, content.encoding, content_encoding, data, size)
+            self.size += size
+
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= evicted[4]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+
+body_cache = BodyCache()
+
+
+def decode_bytes(content, content_encoding=None):
+    data = body_cache.get(content, content_encoding)
+    if data is None:
+        data = b"".join(iter_bytes(content, content_encoding))
+        body_cache.put(content, content_encoding, data)
+
+    return data
+
+
+def _charset(mime_type):
+    for param in (mime_type or "").split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset":
+            charset = value.strip().strip('"')
+            try:
+                codecs.lookup(charset)
+            except LookupError:
+                return None
+            return charset
+
+    return None
+
+
+def decode_text(content, content_encoding=None, charset=None):
+    if content.encoding is None and not _decoders(content_encoding):
+        return content.text or ""
+
+    charset = charset or _charset(content.mime_type) or "utf-8"
+    return decode_bytes(content, content_encoding).decode(charset, errors="replace")
+
+
+def set_bytes(content, data, mime_type=None):
+    """
+    Stores `data` as the body of `content`, as plain text when it is valid
+    UTF-8 and base64 encoded otherwise.
+    """
+    if mime_type is not None:
+        content.mime_type = mime_type
+
+    try:
+        content.text = data.decode("utf-8")
+        content.encoding = None
+    except UnicodeDecodeError:
+        content.text = base64.b64encode(data).decode("ascii")
+        content.encoding = "base64"
+
+    content.size = len(data)
+    body_cache.put(content, None, bytes(data))
@@ -0,0 +1,127 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import threading
+from collections import deque
+
+from .model import HAR, Log
+from .schema import HARSchema
+
+
+def entry_size(entry):
+    """
+    Approximate memory held by an entry, counted as the UTF-8 encoded size of
+    the request and response bodies.
+    """
+    size = 0
+
+    request, response = entry.request, entry.response
+    if request is not None and request.post_data is not None:
+        size += len((request.post_data.text or "").encode("utf-8"))
+    if response is not None and response.content is not None:
+        size += len((response.content.text or "").encode("utf-8"))
+
+    return size
+
+
+class CaptureLog:
+    """
+    Log holding only the most recent entries, bounded by entry count and/or by
+    total body size as computed by `entry_size`.
+
+    Evicted entries are written to `spill`, typically a `HARWriter`, when one
+    is given, in eviction order and outside of the lock held by appends. An
+    entry whose write fails stays pending and is written again by the next
+    append. Appends and snapshots are safe to call from multiple threads;
+    entries should not be modified once appended.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, spill=None, **log_kwargs):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self.log = Log(**log_kwargs)
+        self.size = 0
+        self.evicted = 0
+        self._entries = deque()
+        self._lock = threading.Lock()
+        self._spilled = deque()
+        self._spill_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def append(self, entry):
+        with self._lock:
+            self._append(entry)
+        self._spill()
+
+    def extend(self, entries):
+        with self._lock:
+            for entry in entries:
+                self._append(entry)
+        self._spill()
+
+    def _append(self, entry):
+        size = entry_size(entry)
+        self._entries.append((entry, size))
+        self.size += size
+
+        while self._entries and self._over_limit():
+            evicted, evicted_size = self._entries.popleft()
+            self.size -= evicted_size
+            self.evicted += 1
+
+            if self.spill is not None:
+                self._spilled.append(evicted)
+
+    def _spill(self):
+        if not self._spilled:
+            return
+
+        with self._spill_lock:
+            while self._spilled:
+                self.spill.write(self._spilled[0])
+                self._spilled.popleft()
+
+    def _over_limit(self):
+        return ((self.max_entries is not None and len(self._entries) > self.max_entries) or
+                (self.max_bytes is not None and self.size > self.max_bytes))
+
+    def snapshot(self):
+        """
+        Returns a `Log` with the entries held at the time of the call.
+        """
+        with self._lock:
+            entries = [entry for entry, _ in self._entries]
+
+        return Log(version=self.log.version,
+                   creator=self.log.creator,
+                   browser=self.log.browser,
+                   pages=list(self.log.pages),
+                   entries=entries,
+                   comment=self.log.comment,
+                   extended_arguments=self.log.extended_arguments)
+
+    def dump(self):
+        return HARSchema().dump(HAR(log=self.snapshot()))
@@ -0,0 +1,167 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import Counter, OrderedDict, namedtuple
+from itertools import zip_longest
+
+from .model import Timings
+from .stream import HARReader
+
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+EntryDiff = namedtuple("EntryDiff", ("kind", "method", "url", "ordinal", "changes"))
+FieldChange = namedtuple("FieldChange", ("field", "old", "new"))
+
+_Snapshot = namedtuple("_Snapshot", (
+    "digest", "request_headers", "status", "response_headers", "content_size", "timings",
+))
+
+
+def _headers(headers):
+    return tuple(sorted(((header.name.lower(), header.value) for header in headers or []),
+                        key=lambda header: (header[0], header[1] or "")))
+
+
+def _snapshot(entry):
+    request, response = entry.request, entry.response
+
+    request_headers = _headers(request.headers) if request else ()
+    status = response.status if response else None
+    response_headers = _headers(response.headers) if response else ()
+    content_size = response.content.size if response and response.content else None
+    timings = tuple(getattr(entry.timings, phase) for phase in Timings.phases) if entry.timings else None
+
+    fields = (request_headers, status, response_headers, content_size, timings)
+    return _Snapshot(hash(fields), *fields)
+
+
+def _key(entry, ordinals):
+    request = entry.request
+    method_url = (request.method, request.url) if request else (None, None)
+    ordinal = ordinals[method_url]
+    ordinals[method_url] += 1
+    return method_url + (ordinal,)
+
+
+def _header_changes(field, old, new):
+    old_values, new_values = {}, {}
+    for name, value in old:
+        old_values.setdefault(name, []).append(value)
+    for name, value in new:
+        new_values.setdefault(name, []).append(value)
+
+    for name in sorted(set(old_values) | set(new_values)):
+        before, after = old_values.get(name), new_values.get(name)
+        if before != after:
+            yield FieldChange("%s.%s" % (field, name), before, after)
+
+
+def _changes(old, new):
+    if old.digest == new.digest and old == new:
+        return []
+
+    changes = []
+    changes.extend(_header_changes("request.headers", old.request_headers, new.request_headers))
+
+    if old.status != new.status:
+        changes.append(FieldChange("response.status", old.status, new.status))
+
+    changes.extend(_header_changes("response.headers", old.response_headers, new.response_headers))
+
+    if old.content_size != new.content_size:
+        changes.append(FieldChange("response.content.size", old.content_size, new.content_size))
+
+    if old.timings != new.timings:
+        if old.timings is None or new.timings is None:
+            changes.append(FieldChange("timings", old.timings, new.timings))
+        else:
+            changes.extend(FieldChange("timings.%s" % phase, before, after)
+                           for phase, before, after in zip(Timings.phases, old.timings, new.timings)
+                           if before != after)
+
+    return changes
+
+
+def diff_entries(old_entries, new_entries, window=None):
+    """
+    Aligns two sequences of entries by method, URL and ordinal of occurrence
+    and yields an `EntryDiff` for every added, removed or changed entry.
+
+    Entries waiting for their counterpart are kept as a snapshot of the
+    compared fields only: status, content size, timings and the full request
+    and response header lists, but no bodies. When `window` is set, at most that many entries are
+    kept pending on each side; older ones are reported as removed or added,
+    which bounds memory at the cost of missing matches further apart.
+    """
+    pending_old, pending_new = OrderedDict(), OrderedDict()
+    old_ordinals, new_ordinals = Counter(), Counter()
+
+    for old, new in zip_longest(old_entries, new_entries):
+        if old is not None:
+            key, snapshot = _key(old, old_ordinals), _snapshot(old)
+            if key in pending_new:
+                changes = _changes(snapshot, pending_new.pop(key))
+                if changes:
+                    yield EntryDiff(CHANGED, *key, changes=changes)
+            else:
+                pending_old[key] = snapshot
+
+        if new is not None:
+            key, snapshot = _key(new, new_ordinals), _snapshot(new)
+            if key in pending_old:
+                changes = _changes(pending_old.pop(key), snapshot)
+                if changes:
+                    yield EntryDiff(CHANGED, *key, changes=changes)
+            else:
+                pending_new[key] = snapshot
+
+        if window is not None:
+            while len(pending_old) > window:
+                key, _ = pending_old.popitem(last=False)
+                yield EntryDiff(REMOVED, *key, changes=[])
+
+            while len(pending_new) > window:
+                key, _ = pending_new.popitem(last=False)
+                yield EntryDiff(ADDED, *key, changes=[])
+
+    for key in pending_old:
+        yield EntryDiff(REMOVED, *key, changes=[])
+
+    for key in pending_new:
+        yield EntryDiff(ADDED, *key, changes=[])
+
+
+def diff_logs(old_log, new_log):
+    return list(diff_entries(old_log.entries, new_log.entries))
+
+
+def diff_files(old_fp, new_fp, window=10000, chunk_size=65536):
+    """
+    Streams the entries of two HAR files side by side, see `diff_entries`.
+    """
+    return diff_entries(HARReader(old_fp, chunk_size=chunk_size),
+                        HARReader(new_fp, chunk_size=chunk_size),
+                        window=window)
@@ -0,0 +1,191 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import random
+import string
+from datetime import datetime, timedelta, timezone
+
+from .model import Timings
+
+
+_ALPHABET = string.ascii_letters + string.digits + " -_./:;=&?%\"'\\é中\U0001f600"
+_METHODS = ("GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS")
+_VERSIONS = ("HTTP/1.0", "HTTP/1.1", "h2", "http/2.0")
+_MIME_TYPES = ("text/html", "text/html; charset=utf-8", "application/json", "image/png",
+               "application/x-www-form-urlencoded", "multipart/form-data; boundary=xyz")
+
+
+class HARGenerator:
+    """
+    Generates random, valid HAR documents as dictionaries.
+
+    Documents are in the form produced by `HARSchema().dump()`: every field is
+    present, so loading and dumping one must give it back unchanged. Optional
+    objects are randomly left out and extended `_` attributes are randomly
+    added at every level.
+    """
+
+    def __init__(self, seed=None, extended=True):
+        self.random = random.Random(seed)
+        self.extended = extended
+
+    def _text(self, max_length=12):
+        return "".join(self.random.choice(_ALPHABET) for _ in range(self.random.randint(0, max_length)))
+
+    def _int(self, unknown=True):
+        return -1 if unknown and self.random.random() < 0.2 else self.random.randint(0, 100000)
+
+    def _maybe(self, factory, probability=0.5):
+        return factory() if self.random.random() < probability else None
+
+    def _many(self, factory, maximum=3):
+        return [factory() for _ in range(self.random.randint(0, maximum))]
+
+    def _datetime(self):
+        offset = timezone(timedelta(minutes=self.random.randrange(-12 * 60, 14 * 60, 15)))
+        value = datetime(2000, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=self.random.randint(0, 10 ** 9))
+        value = value.replace(microsecond=self.random.choice((0, self.random.randint(0, 999999))))
+        return value.astimezone(offset).isoformat()
+
+    def _extended_value(self, depth=0):
+        kind = self.random.randint(0, 5 if depth < 2 else 3)
+        if kind == 0:
+            return None
+        elif kind == 1:
+            return self._text()
+        elif kind == 2:
+            return self.random.randint(-1000, 1000)
+        elif kind == 3:
+            return self.random.random() < 0.5
+        elif kind == 4:
+            return [self._extended_value(depth + 1) for _ in range(self.random.randint(0, 3))]
+        else:
+            return {self._text(6): self._extended_value(depth + 1) for _ in range(self.random.randint(0, 3))}
+
+    def _model(self, **fields):
+        fields["comment"] = self._text() if self.random.random() < 0.3 else ""
+        if self.extended:
+            for i in range(self.random.choice((0, 0, 1, 2))):
+                fields["_%s%d" % (self.random.choice(("ext", "priority", "resourceType")), i)] = \
+                    self._extended_value()
+        return fields
+
+    def cookie(self):
+        return self._model(name=self._text(), value=self._text(),
+                           path=self._maybe(lambda: "/" + self._text()),
+                           domain=self._maybe(lambda: "example.com"),
+                           expires=self._maybe(self._datetime),
+                           httpOnly=self.random.random() < 0.5,
+                           secure=self.random.random() < 0.5)
+
+    def cache_state(self):
+        return self._model(expires=self._maybe(self._datetime),
+                           lastAccess=self._maybe(self._datetime),
+                           eTag=self._maybe(self._text),
+                           hitCount=self._int(unknown=False))
+
+    def cache(self):
+        return self._model(beforeRequest=self._maybe(self.cache_state),
+                           afterRequest=self._maybe(self.cache_state))
+
+    def content(self):
+        return self._model(size=self._int(),
+                           mimeType=self._maybe(lambda: self.random.choice(_MIME_TYPES), 0.8),
+                           text=self._text(200),
+                           encoding=self._maybe(lambda: "base64", 0.2))
+
+    def timings(self):
+        return self._model(**{phase: self._int() for phase in Timings.phases})
+
+    def header(self):
+        return self._model(name=self._text(), value=self._text(40))
+
+    def post_param(self):
+        return self._model(name=self._text(), value=self._text(),
+                           fileName=self._maybe(self._text, 0.2),
+                           contentType=self._maybe(lambda: self.random.choice(_MIME_TYPES), 0.2))
+
+    def post_data(self):
+        return self._model(mimeType=self._maybe(lambda: self.random.choice(_MIME_TYPES)),
+                           params=self._many(self.post_param),
+                           text=self._text(100))
+
+    def param(self):
+        return self._model(name=self._text(), value=self._text())
+
+    def request(self):
+        return self._model(method=self.random.choice(_METHODS),
+                           url="http://example%d.com/%s?%s" % (self.random.randint(0, 9), self._text(), self._text()),
+                           httpVersion=self.random.choice(_VERSIONS),
+                           cookies=self._many(self.cookie),
+                           headers=self._many(self.header, 6),
+                           queryString=self._many(self.param),
+                           postData=self.post_data(),
+                           headerSize=self._int(),
+                           bodySize=self._int())
+
+    def response(self):
+        return self._model(status=self.random.choice((0, 200, 204, 301, 304, 404, 500)),
+                           statusText=self._text(),
+                           httpVersion=self.random.choice(_VERSIONS),
+                           cookies=self._many(self.cookie),
+                           headers=self._many(self.header, 6),
+                           content=self._maybe(self.content, 0.8),
+                           redirectURL=self._text(),
+                           headerSize=self._int(),
+                           bodySize=self._int())
+
+    def entry(self, pageref=None):
+        return self._model(pageref=pageref,
+                           startedDateTime=self._maybe(self._datetime, 0.9),
+                           time=self._int(),
+                           request=self._maybe(self.request, 0.95),
+                           response=self._maybe(self.response, 0.9),
+                           cache=self._maybe(self.cache, 0.3),
+                           timings=self._maybe(self.timings, 0.8),
+                           serverIPAddress=self._maybe(lambda: "10.0.0.%d" % self.random.randint(0, 255)),
+                           connection=self._maybe(lambda: str(self.random.randint(0, 65535))))
+
+    def creator(self):
+        return self._model(name=self._text(), version=self._text(4))
+
+    def page_timings(self):
+        return self._model(onContentLoad=self._int(), onLoad=self._int())
+
+    def page(self, id):
+        return self._model(id=id,
+                           title=self._text(),
+                           startedDateTime=self._maybe(self._datetime, 0.9),
+                           pageTimings=self._maybe(self.page_timings, 0.8))
+
+    def log(self, entries=10):
+        pages = [self.page("page_%d" % i) for i in range(self.random.randint(0, 3))]
+        pagerefs = [page["id"] for page in pages] + [None]
+        return self._model(version=self.random.choice(("1.1", "1.2")),
+                           creator=self._maybe(self.creator, 0.9),
+                           browser=self._maybe(self.creator),
+                           pages=pages,
+                           entries=[self.entry(self.random.choice(pagerefs)) for _ in range(entries)])
+
+    def har(self, entries=10):
+        return self._model(log=self.log(entries))
@@ -41,7 +41,13 @@ class Schema(BaseSchema):
                 if isinstance(data, dict):
                     data["extended_arguments"] = extended_arguments
 
-            return self.__model__(**data)
+            model = self.__model__(**data)
+
+            if self.context.get('populate_params') and isinstance(model, Request):
+                from .parsing import populate_request
+                populate_request(model)
+
+            return model
 
         return self.__model__(**data)
 
@@ -67,17 +73,24 @@ class Model():
         comment: str="") -> None: pass
 
     def __getattr__(self, name):
-        if name.startswith('__'):
-            raise AttributeError()
+        if name.startswith('_'):
+            raise AttributeError(name)
 
         return getattr(self.log, name)
 
+    def _fields(self):
+        # Attributes starting with an underscore hold derived, cached values.
+        return {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+
+    def __getstate__(self):
+        return self._fields()
+
     def __eq__(self, other):
         return (self.__class__ == other.__class__ and
-                self.__dict__ == other.__dict__)
+                self._fields() == other._fields())
 
     def __repr__(self):
-        return "%s(%s)" % (self.__class__.__name__, repr(self.__dict__))
+        return "%s(%s)" % (self.__class__.__name__, repr(self._fields()))
 
 
 @HAR_SCHEMA_FACTORY
@@ -125,9 +138,34 @@ class Content(Model):
         text: str="",
         encoding: str=None) -> None: pass
 
+    def bytes(self, content_encoding=None):
+        """
+        Returns the decoded body. `content_encoding` is the response's
+        Content-Encoding header, when the text is still compressed.
+        """
+        from .body import decode_bytes
+        return decode_bytes(self, content_encoding)
+
+    def iter_bytes(self, content_encoding=None, chunk_size=65536):
+        from .body import iter_bytes
+        return iter_bytes(self, content_encoding, chunk_size=chunk_size)
+
+    def decoded_text(self, content_encoding=None, charset=None):
+        """
+        Returns the body as text, using the charset of the mime type when none
+        is given.
+        """
+        from .body import decode_text
+        return decode_text(self, content_encoding, charset=charset)
+
+    def set_bytes(self, data, mime_type=None):
+        from .body import set_bytes
+        set_bytes(self, data, mime_type=mime_type)
+
 
 @HAR_SCHEMA_FACTORY
 class Timings(Model):
+    phases = ("blocked", "dns", "connect", "send", "wait", "receive", "ssl")
 
     def __init__(
         self, *,
@@ -190,6 +228,22 @@ class Request(Model):
             **kwargs) -> None:
         self.post_data = post_data or PostData()
 
+    @property
+    def parsed(self):
+        """
+        Parsed view of the URL and post data, cached until either changes.
+        """
+        from .parsing import ParsedRequest
+
+        post_data = self.post_data
+        key = (self.url, post_data.mime_type, post_data.text) if post_data is not None else (self.url, None, None)
+
+        parsed = self.__dict__.get('_parsed')
+        if parsed is None or parsed.key != key:
+            parsed = self.__dict__['_parsed'] = ParsedRequest(*key)
+
+        return parsed
+
 
 @HAR_SCHEMA_FACTORY
 class Response(Model):
@@ -207,6 +261,14 @@ class Response(Model):
         header_size: int=-1,
         body_size: int=-1) -> None: pass
 
+    @property
+    def content_encoding(self):
+        for header in self.headers:
+            if header.name.lower() == "content-encoding":
+                return header.value
+
+        return None
+
 
 @HAR_SCHEMA_FACTORY
 class Creator(Model):
@@ -0,0 +1,119 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+from .schema import EntrySchema
+from .stream import HARWriter
+
+
+_EXECUTORS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+def _default_executor():
+    # sys._is_gil_enabled only exists from Python 3.13.
+    gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return "thread" if gil_enabled is not None and not gil_enabled() else "process"
+
+
+def _chunks(entries, chunk_size):
+    entries = iter(entries)
+    while True:
+        chunk = list(islice(entries, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def dump_chunk(entries):
+    """
+    Serializes entries to a comma separated JSON fragment.
+    """
+    return ", ".join(json.dumps(data) for data in EntrySchema(many=True).dump(entries))
+
+
+def _write_chunks(writer, pool, entries, chunk_size, in_flight):
+    pending = deque()
+
+    for chunk in _chunks(entries, chunk_size):
+        pending.append((pool.submit(dump_chunk, chunk), len(chunk)))
+
+        while len(pending) > in_flight:
+            future, count = pending.popleft()
+            writer.write_fragment(future.result(), count=count)
+
+    for future, count in pending:
+        writer.write_fragment(future.result(), count=count)
+
+
+def dump_parallel(har, fp, executor=None, workers=None, chunk_size=1000):
+    """
+    Writes `har` to the text file `fp`, serializing chunks of entries
+    concurrently and writing them in their original order.
+
+    `executor` is "thread", "process" or an existing `Executor`. Serialization
+    holds the GIL, so threads do not run it in parallel on regular builds: the
+    default is "process" there, which pays for pickling the entries, and
+    "thread" on free-threaded builds.
+
+    If a chunk fails to serialize, the exception propagates and the output is
+    left unterminated, see `HARWriter`.
+
+    Returns the number of entries written.
+    """
+    log = har.log
+    executor = executor or _default_executor()
+    workers = workers or os.cpu_count() or 1
+    writer = HARWriter(fp,
+                       har_comment=har.comment,
+                       har_extended_arguments=har.extended_arguments,
+                       version=log.version,
+                       creator=log.creator,
+                       browser=log.browser,
+                       pages=log.pages,
+                       comment=log.comment,
+                       extended_arguments=log.extended_arguments)
+
+    with writer:
+        if isinstance(executor, Executor):
+            _write_chunks(writer, executor, log.entries, chunk_size, in_flight=2 * workers)
+        else:
+            with _EXECUTORS[executor](max_workers=workers) as pool:
+                _write_chunks(writer, pool, log.entries, chunk_size, in_flight=2 * workers)
+
+    return writer.count
+
+
+def dumps_parallel(har, **kwargs):
+    out = io.StringIO()
+    dump_parallel(har, out, **kwargs)
+    return out.getvalue()
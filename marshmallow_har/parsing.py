@@ -0,0 +1,129 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from email.parser import Parser
+from email.policy import HTTP
+from urllib.parse import parse_qsl, urlsplit
+
+from .model import Param, PostParam
+
+
+def _mime_type(value):
+    return (value or "").split(";")[0].strip().lower()
+
+
+def url_hostname(url):
+    """
+    Lowercased host name of `url`, or None when it has none or cannot be split.
+    """
+    try:
+        return urlsplit(url).hostname if url else None
+    except ValueError:
+        return None
+
+
+def parse_multipart(mime_type, text):
+    """
+    Returns the fields of a multipart/form-data body as `PostParam` models.
+    `mime_type` must carry the boundary parameter.
+    """
+    message = Parser(policy=HTTP).parsestr("Content-Type: %s\r\n\r\n%s" % (mime_type, text))
+    if not message.is_multipart():
+        return []
+
+    params = []
+    for part in message.get_payload():
+        params.append(PostParam(name=part.get_param("name", header="content-disposition"),
+                                value=part.get_payload(),
+                                file_name=part.get_filename(),
+                                content_type=part.get("Content-Type")))
+
+    return params
+
+
+class ParsedRequest:
+    """
+    URL components and parameters derived from a request, parsed on first
+    access. Obtained through `Request.parsed`. A URL that cannot be split,
+    such as an unterminated IPv6 host, has no components or query parameters.
+    """
+
+    def __init__(self, url, mime_type=None, text=None):
+        self.key = (url, mime_type, text)
+        try:
+            self.url = urlsplit(url)
+        except ValueError:
+            self.url = urlsplit("")
+        self._query_params = None
+        self._post_params = None
+
+    @property
+    def query_params(self):
+        if self._query_params is None:
+            self._query_params = [Param(name=name, value=value)
+                                  for name, value in parse_qsl(self.url.query, keep_blank_values=True)]
+        return self._query_params
+
+    @property
+    def post_params(self):
+        if self._post_params is None:
+            _, mime_type, text = self.key
+            content_type = _mime_type(mime_type)
+
+            if not text:
+                self._post_params = []
+            elif content_type == "application/x-www-form-urlencoded":
+                self._post_params = [PostParam(name=name, value=value)
+                                     for name, value in parse_qsl(text, keep_blank_values=True)]
+            elif content_type == "multipart/form-data":
+                self._post_params = parse_multipart(mime_type, text)
+            else:
+                self._post_params = []
+
+        return self._post_params
+
+
+def populate_request(request):
+    """
+    Fills in an empty `query_string` and `post_data.params` from the URL and
+    post data of the request.
+    """
+    if not request.query_string:
+        request.query_string = list(request.parsed.query_params)
+
+    post_data = request.post_data
+    if post_data is not None and not post_data.params:
+        post_data.params = list(request.parsed.post_params)
+
+
+def populate_params(entries):
+    """
+    Applies `populate_request` to the requests of already loaded entries.
+
+    To do the same while loading, pass `populate_params` in the schema
+    context: `HARSchema(context={"populate_params": True}).load(data)`, or
+    the `populate_params` option of `HARReader`.
+    """
+    for entry in entries:
+        if entry.request is not None:
+            populate_request(entry.request)
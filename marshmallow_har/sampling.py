@@ -0,0 +1,105 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import random
+from collections import OrderedDict, namedtuple
+
+from .parsing import url_hostname
+from .schema import EntrySchema
+from .stream import HARReader
+
+
+Stratum = namedtuple("Stratum", ("population", "entries"))
+
+
+def _host(raw):
+    return url_hostname((raw.get("request") or {}).get("url"))
+
+
+def _status(raw):
+    return (raw.get("response") or {}).get("status")
+
+
+STRATA = {
+    "host": _host,
+    "status": _status,
+}
+
+
+class _Reservoir:
+
+    def __init__(self, size, rng):
+        self.size = size
+        self.rng = rng
+        self.seen = 0
+        self.items = []
+
+    def add(self, index, raw):
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append((index, raw))
+        else:
+            slot = self.rng.randrange(self.seen)
+            if slot < self.size:
+                self.items[slot] = (index, raw)
+
+    def entries(self, schema):
+        return [schema.load(raw) for _, raw in sorted(self.items, key=lambda item: item[0])]
+
+
+def reservoir_sample(fp, k, seed=None, chunk_size=65536):
+    """
+    Returns `k` entries of a HAR file chosen uniformly at random, in file
+    order. Entries are streamed as raw dictionaries and only the selected
+    ones are loaded as `Entry` models.
+    """
+    reservoir = _Reservoir(k, random.Random(seed))
+    for index, raw in enumerate(HARReader(fp, chunk_size=chunk_size).raw_entries()):
+        reservoir.add(index, raw)
+
+    return reservoir.entries(EntrySchema())
+
+
+def stratified_sample(fp, k, by="host", seed=None, chunk_size=65536):
+    """
+    Samples up to `k` entries from each stratum of a HAR file, strata being
+    defined by "host", "status" or a callable taking the raw entry
+    dictionary.
+
+    Returns an ordered mapping of stratum to `Stratum`, holding the number of
+    entries seen in the stratum and the sampled entries in file order.
+    """
+    key = STRATA[by] if isinstance(by, str) else by
+    rng = random.Random(seed)
+    reservoirs = OrderedDict()
+
+    for index, raw in enumerate(HARReader(fp, chunk_size=chunk_size).raw_entries()):
+        stratum = key(raw)
+        reservoir = reservoirs.get(stratum)
+        if reservoir is None:
+            reservoir = reservoirs[stratum] = _Reservoir(k, rng)
+        reservoir.add(index, raw)
+
+    schema = EntrySchema()
+    return OrderedDict((stratum, Stratum(reservoir.seen, reservoir.entries(schema)))
+                       for stratum, reservoir in reservoirs.items())
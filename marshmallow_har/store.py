@@ -0,0 +1,345 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+from marshmallow import ValidationError, fields
+
+from .parsing import url_hostname
+from .schema import EntrySchema
+from .stream import HARReader, HARWriter
+
+
+_TABLES = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    pageref TEXT,
+    started_date_time TEXT,
+    started_time INTEGER,
+    time INTEGER,
+    method TEXT,
+    url TEXT,
+    host TEXT,
+    status INTEGER,
+    mime_type TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS headers (
+    entry_id INTEGER NOT NULL REFERENCES entries(id),
+    source TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    value TEXT,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS cookies (
+    entry_id INTEGER NOT NULL REFERENCES entries(id),
+    source TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    value TEXT,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS query_params (
+    entry_id INTEGER NOT NULL REFERENCES entries(id),
+    source TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    value TEXT,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS bodies (
+    entry_id INTEGER NOT NULL REFERENCES entries(id),
+    source TEXT NOT NULL,
+    text TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_url ON entries(url);
+CREATE INDEX IF NOT EXISTS entries_host ON entries(host);
+CREATE INDEX IF NOT EXISTS entries_status ON entries(status);
+CREATE INDEX IF NOT EXISTS entries_started_time ON entries(started_time);
+CREATE INDEX IF NOT EXISTS headers_entry ON headers(entry_id);
+CREATE INDEX IF NOT EXISTS headers_name ON headers(name);
+CREATE INDEX IF NOT EXISTS cookies_entry ON cookies(entry_id);
+CREATE INDEX IF NOT EXISTS query_params_entry ON query_params(entry_id);
+CREATE INDEX IF NOT EXISTS query_params_name ON query_params(name);
+CREATE INDEX IF NOT EXISTS bodies_entry ON bodies(entry_id);
+"""
+
+# (table, source, path of the parent object in the entry, list key)
+_LISTS = [
+    ("headers", "request", ("request",), "headers"),
+    ("headers", "response", ("response",), "headers"),
+    ("cookies", "request", ("request",), "cookies"),
+    ("cookies", "response", ("response",), "cookies"),
+    ("query_params", "request", ("request",), "queryString"),
+]
+
+# (source, path of the parent object in the entry, text key)
+_BODIES = [
+    ("request", ("request", "postData"), "text"),
+    ("response", ("response", "content"), "text"),
+]
+
+_FILTERS = {
+    "url": "url = ?",
+    "host": "host = ?",
+    "status": "status = ?",
+    "method": "method = ?",
+    "pageref": "pageref = ?",
+    "mime_type": "mime_type = ?",
+    "since": "started_time >= ?",
+    "until": "started_time < ?",
+}
+
+
+def _lookup(data, path):
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+
+    return data if isinstance(data, dict) else None
+
+
+_DATETIME = fields.DateTime(format="iso")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _epoch_milliseconds(value):
+    """
+    Converts a datetime or ISO 8601 string to milliseconds since the epoch,
+    naive values being taken as UTC.
+    """
+    if isinstance(value, str):
+        value = _DATETIME.deserialize(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return (value - _EPOCH) // timedelta(milliseconds=1)
+
+
+def _started_time(value):
+    if value is None:
+        return None
+
+    try:
+        return _epoch_milliseconds(value)
+    except ValidationError:
+        return None
+
+
+def _filter_value(name, value):
+    return _epoch_milliseconds(value) if name in ("since", "until") else value
+
+
+class SQLiteStore:
+    """
+    Stores HAR entries in a SQLite database, with headers, cookies, query
+    parameters and bodies kept in separate tables.
+
+    Entries are stored as dumped by `EntrySchema` and loaded back through it,
+    extended attributes and comments included.
+    """
+
+    def __init__(self, path=":memory:"):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_TABLES)
+        self._schema = EntrySchema()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def ingest(self, entries, batch_size=1000):
+        """
+        Inserts `Entry` models, one transaction per batch. Returns the number
+        of inserted entries.
+        """
+        return self.ingest_raw((self._schema.dump(entry) for entry in entries), batch_size=batch_size)
+
+    def ingest_log(self, log, batch_size=1000):
+        return self.ingest(log.entries, batch_size=batch_size)
+
+    def ingest_file(self, fp, batch_size=1000):
+        """
+        Streams the entries of a HAR file into the store without building
+        models.
+        """
+        return self.ingest_raw(HARReader(fp).raw_entries(), batch_size=batch_size)
+
+    def ingest_raw(self, entries, batch_size=1000):
+        entries = iter(entries)
+        count = 0
+
+        while True:
+            batch = list(islice(entries, batch_size))
+            if not batch:
+                return count
+
+            with self.connection:
+                self._insert(batch)
+
+            count += len(batch)
+
+    def _insert(self, batch):
+        next_id, = self.connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM entries").fetchone()
+
+        rows = {"entries": [], "headers": [], "cookies": [], "query_params": [], "bodies": []}
+
+        for entry_id, data in enumerate(batch, start=next_id):
+            data = json.loads(json.dumps(data))
+
+            for table, source, path, key in _LISTS:
+                parent = _lookup(data, path)
+                if parent is None or not isinstance(parent.get(key), list):
+                    continue
+
+                for position, item in enumerate(parent.pop(key)):
+                    extra = {k: v for k, v in item.items() if k not in ("name", "value")}
+                    rows[table].append((entry_id, source, position, item.get("name"), item.get("value"),
+                                        json.dumps(extra) if extra else None))
+
+            for source, path, key in _BODIES:
+                parent = _lookup(data, path)
+                if parent is not None and isinstance(parent.get(key), str) and parent[key]:
+                    rows["bodies"].append((entry_id, source, parent.pop(key)))
+
+            request = data.get("request") or {}
+            response = data.get("response") or {}
+            content = response.get("content") or {}
+            url = request.get("url")
+
+            rows["entries"].append((
+                entry_id,
+                data.get("pageref"),
+                data.get("startedDateTime"),
+                _started_time(data.get("startedDateTime")),
+                data.get("time"),
+                request.get("method"),
+                url,
+                url_hostname(url),
+                response.get("status"),
+                content.get("mimeType"),
+                json.dumps(data),
+            ))
+
+        self.connection.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows["entries"])
+        self.connection.executemany("INSERT INTO bodies VALUES (?, ?, ?)", rows["bodies"])
+        for table in ("headers", "cookies", "query_params"):
+            self.connection.executemany("INSERT INTO %s VALUES (?, ?, ?, ?, ?, ?)" % table, rows[table])
+
+    def _where(self, filters):
+        unknown = set(filters) - set(_FILTERS)
+        if unknown:
+            raise TypeError("Unknown filters: %s" % ", ".join(sorted(unknown)))
+
+        clauses, params = [], []
+        for name, value in sorted(filters.items()):
+            if value is not None:
+                clauses.append(_FILTERS[name])
+                params.append(_filter_value(name, value))
+
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def count(self, **filters):
+        where, params = self._where(filters)
+        count, = self.connection.execute("SELECT COUNT(*) FROM entries" + where, params).fetchone()
+        return count
+
+    def query_raw(self, limit=None, batch_size=500, **filters):
+        """
+        Yields entries matching the filters as dumped dictionaries, in
+        insertion order. Filters: url, host, status, method, pageref,
+        mime_type, since and until (bounds on startedDateTime, as datetimes
+        or ISO 8601 strings, compared in UTC).
+        """
+        where, params = self._where(filters)
+        sql = "SELECT id, data FROM entries" + where + " ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self.connection.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+
+            yield from self._assemble(rows)
+
+    def query(self, limit=None, batch_size=500, **filters):
+        """
+        Same as `query_raw`, loading each entry as an `Entry` model only when
+        it is reached.
+        """
+        for data in self.query_raw(limit=limit, batch_size=batch_size, **filters):
+            yield self._schema.load(data)
+
+    def _assemble(self, rows):
+        ids = [entry_id for entry_id, _ in rows]
+        entries = {entry_id: json.loads(data) for entry_id, data in rows}
+        marks = ", ".join("?" * len(ids))
+
+        for source, path, key in _BODIES:
+            for entry_id, text in self.connection.execute(
+                    "SELECT entry_id, text FROM bodies WHERE source = ? AND entry_id IN (%s)" % marks,
+                    [source] + ids):
+                _lookup(entries[entry_id], path)[key] = text
+
+        for table, source, path, key in _LISTS:
+            for data in entries.values():
+                parent = _lookup(data, path)
+                if parent is not None:
+                    parent[key] = []
+
+            for entry_id, name, value, extra in self.connection.execute(
+                    "SELECT entry_id, name, value, extra FROM %s WHERE source = ? AND entry_id IN (%s) "
+                    "ORDER BY entry_id, position" % (table, marks),
+                    [source] + ids):
+                item = {"name": name, "value": value}
+                if extra:
+                    item.update(json.loads(extra))
+                _lookup(entries[entry_id], path)[key].append(item)
+
+        for entry_id in ids:
+            yield entries[entry_id]
+
+    def export(self, fp, entries=None, **log_kwargs):
+        """
+        Writes a HAR document containing `entries`, typically the result of
+        `query()`, or every stored entry. Keyword arguments are passed to
+        `Log`.
+        """
+        with HARWriter(fp, **log_kwargs) as writer:
+            for entry in self.query() if entries is None else entries:
+                writer.write(entry)
+
+            return writer.count
@@ -0,0 +1,251 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import re
+
+from .model import HAR, Log
+from .schema import EntrySchema, HARSchema, LogSchema
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+
+class _Scanner:
+
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size):
+        if self.eof:
+            return False
+
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+
+        data = self.fp.read(size)
+        if not data:
+            self.eof = True
+            return False
+
+        self.buffer += data
+        return True
+
+    def peek(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+
+            if not self.fill(self.chunk_size):
+                raise ValueError("Unexpected end of HAR document")
+
+    def expect(self, chars):
+        char = self.peek()
+        if char not in chars:
+            raise ValueError("Expected one of %r at offset %d, found %r" % (chars, self.pos, char))
+
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill(size):
+                    raise
+                size *= 2
+                continue
+
+            # A number ending on the buffer boundary may continue in the next chunk.
+            if end == len(self.buffer) and self.fill(size):
+                continue
+
+            self.pos = end
+            return value
+
+    def members(self):
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError("Expected an object key, found %r" % (key,))
+
+            self.expect(":")
+            yield key
+
+            if self.expect(",}") == "}":
+                return
+
+    def items(self):
+        if self.peek() != "[":
+            yield from self.value() or []
+            return
+
+        self.pos += 1
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.value()
+
+            if self.expect(",]") == "]":
+                return
+
+
+class HARReader:
+    """
+    Iterates over the entries of a HAR document without loading the whole file.
+
+    Only one entry is held in memory at a time. Fields of the log other than
+    the entries are collected in `log_fields` as they are encountered, so
+    values appearing after the entries are only available once iteration is
+    complete.
+
+    With `populate_params`, empty query strings and post parameters are
+    filled in from the request URL and post data as entries are loaded.
+    """
+
+    def __init__(self, fp, chunk_size=65536, populate_params=False):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.populate_params = populate_params
+        self.fields = {}
+        self.log_fields = {}
+        self._schema = EntrySchema(context={"populate_params": populate_params})
+
+    def raw_entries(self):
+        scanner = _Scanner(self.fp, self.chunk_size)
+
+        for key in scanner.members():
+            if key != "log":
+                self.fields[key] = scanner.value()
+                continue
+
+            for log_key in scanner.members():
+                if log_key == "entries":
+                    yield from scanner.items()
+                else:
+                    self.log_fields[log_key] = scanner.value()
+
+    def __iter__(self):
+        for raw in self.raw_entries():
+            yield self._schema.load(raw)
+
+
+class HARWriter:
+    """
+    Writes a HAR document one entry at a time.
+
+    Keyword arguments are passed to `Log` and written ahead of the entries.
+    `har_comment` and `har_extended_arguments` are the fields of the HAR
+    object itself. The document is completed by `close()`, or when leaving
+    the context manager without an exception. After an exception the
+    document is left unterminated, and `failed` is set, so that an
+    incomplete file does not pass for a valid HAR.
+    """
+
+    def __init__(self, fp, har_comment="", har_extended_arguments=None, **log_kwargs):
+        self.fp = fp
+        self.log = Log(**log_kwargs)
+        self.har = HAR(log=Log(), comment=har_comment, extended_arguments=har_extended_arguments)
+        self.count = 0
+        self.closed = False
+        self.failed = False
+        self._started = False
+        self._schema = EntrySchema()
+
+    def _start(self):
+        head = LogSchema().dump(self.log)
+        head.pop("entries", None)
+
+        self.fp.write('{"log": {')
+        for key, value in head.items():
+            self.fp.write('%s: %s, ' % (json.dumps(key), json.dumps(value)))
+        self.fp.write('"entries": [')
+        self._started = True
+
+    def write(self, entry):
+        self.write_raw(self._schema.dump(entry))
+
+    def write_raw(self, data):
+        self.write_fragment(json.dumps(data))
+
+    def write_fragment(self, fragment, count=1):
+        """
+        Writes already serialized entries, separated by commas when `count`
+        is greater than one.
+        """
+        if self.closed:
+            raise ValueError("HARWriter is closed")
+
+        if not self._started:
+            self._start()
+
+        if not count:
+            return
+
+        if self.count:
+            self.fp.write(", ")
+
+        self.fp.write(fragment)
+        self.count += count
+
+    def close(self):
+        if self.closed:
+            return
+
+        if not self._started:
+            self._start()
+
+        tail = HARSchema().dump(self.har)
+        tail.pop("log", None)
+
+        self.fp.write(']}')
+        for key, value in tail.items():
+            self.fp.write(', %s: %s' % (json.dumps(key), json.dumps(value)))
+        self.fp.write('}')
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.failed = self.closed = True
+            return
+
+        self.close()
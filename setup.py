@@ -30,4 +30,8 @@ setup(name='marshmallow-har',
       author_email='info@delvelabs.ca',
       url='https://github.com/delvelabs/marshmallow-har',
       packages=['marshmallow_har'],
-      install_requires=dep_list("requirements.txt"))
+      install_requires=dep_list("requirements.txt"),
+      extras_require={
+          'arrow': ['pyarrow>=1.0'],
+          'brotli': ['brotli'],
+      })
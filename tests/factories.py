@@ -0,0 +1,77 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from datetime import datetime, timedelta, timezone
+
+from marshmallow_har.model import (
+    Content, Cookie, Creator, Entry, HAR, Header, Page, Param, PostData, PostParam, Request, Response, Timings,
+)
+
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def make_entry(url="http://example.com/", method="GET", status=200, request=None, response=None, **kwargs):
+    """
+    Entry with a minimal request and response. `request` and `response` are
+    extra keyword arguments for those models, anything else goes to `Entry`.
+    """
+    return Entry(request=Request(method=method, url=url, **(request or {})),
+                 response=Response(status=status, status_text="OK", **(response or {})),
+                 **kwargs)
+
+
+def make_entries(count, **kwargs):
+    return [make_entry("http://example.com/%d" % i, time=i, **kwargs) for i in range(count)]
+
+
+def make_full_entry(i, host="example.com", status=200):
+    """
+    Entry with every kind of nested model filled in.
+    """
+    return Entry(
+        pageref="page_0",
+        started_date_time=START + timedelta(seconds=i),
+        time=i,
+        request=Request(method="POST" if i % 2 else "GET",
+                        url="http://%s/%d?i=%d" % (host, i, i),
+                        cookies=[Cookie(name="session", value=str(i), http_only=True)],
+                        headers=[Header(name="Host", value=host), Header(name="Accept", value="*/*")],
+                        query_string=[Param(name="i", value=str(i))],
+                        post_data=PostData(mime_type="multipart/form-data; boundary=xyz",
+                                           params=[PostParam(name="file", value="x", file_name="x.txt")],
+                                           text="body %d" % i)),
+        response=Response(status=status,
+                          status_text="OK",
+                          headers=[Header(name="Content-Type", value="text/html")],
+                          content=Content(size=5, mime_type="text/html", text="hello")),
+        timings=Timings(wait=i, receive=1),
+        server_ip_address="10.0.0.1",
+    )
+
+
+def make_har(count=0):
+    return HAR(version="1.2",
+               creator=Creator(name="test", version="1.0"),
+               pages=[Page(id="page_0", title="Hello World")],
+               entries=make_entries(count, pageref="page_0"))
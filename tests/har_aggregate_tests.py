@@ -0,0 +1,82 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+import unittest
+from datetime import timedelta
+
+from marshmallow_har.aggregate import summarize_file, summarize_log
+from marshmallow_har.model import Content, HAR, Log, Page, PageTimings, Timings
+from marshmallow_har.schema import HARSchema
+
+from factories import START, make_entry
+
+
+def make_page_entry(pageref, offset, time, status=200, mime_type="text/html", size=100):
+    return make_entry(status=status,
+                      response={"body_size": size, "content": Content(size=size * 2, mime_type=mime_type)},
+                      pageref=pageref,
+                      started_date_time=START + timedelta(milliseconds=offset),
+                      time=time,
+                      timings=Timings(wait=time, receive=-1))
+
+
+def make_log():
+    return Log(pages=[Page(id="page_0", title="Home", started_date_time=START,
+                           page_timings=PageTimings(on_load=250)),
+                      Page(id="page_1", title="Empty")],
+               entries=[make_page_entry("page_0", 10, 100),
+                        make_page_entry("page_0", 50, 250, status=404, mime_type="Text/HTML; charset=utf-8"),
+                        make_page_entry("page_0", 20, 30, mime_type="image/png", size=-1),
+                        make_page_entry(None, 0, 5)])
+
+
+class SummarizeTest(unittest.TestCase):
+
+    def assert_summaries(self, summaries):
+        self.assertEqual(list(summaries), ["page_0", "page_1", None])
+
+        page = summaries["page_0"]
+        self.assertEqual(page.entry_count, 3)
+        self.assertEqual(page.body_size, 200)
+        self.assertEqual(page.content_size, 400)
+        self.assertEqual(page.timings["wait"], 380)
+        self.assertEqual(page.timings["receive"], 0)
+        self.assertEqual(page.status_counts, {200: 2, 404: 1})
+        self.assertEqual(page.mime_type_counts, {"text/html": 2, "image/png": 1})
+        self.assertEqual(page.start_offset, 10)
+        self.assertEqual(page.end_offset, 300)
+        self.assertEqual(page.duration, 290)
+        self.assertEqual(page.on_load_delta, 50)
+
+        self.assertEqual(summaries["page_1"].entry_count, 0)
+        self.assertIsNone(summaries["page_1"].duration)
+        self.assertIsNone(summaries[None].start_offset)
+
+    def test_summarize_log(self):
+        self.assert_summaries(summarize_log(make_log()))
+
+    def test_summarize_file(self):
+        document = json.dumps(HARSchema().dump(HAR(log=make_log())))
+        self.assert_summaries(summarize_file(io.StringIO(document)))
@@ -0,0 +1,88 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from marshmallow_har.model import Cookie, Entry, Request
+
+from factories import make_full_entry
+
+try:
+    from marshmallow_har import arrow
+except ImportError:
+    arrow = None
+
+
+@unittest.skipIf(arrow is None, "pyarrow is not installed")
+class ArrowConversionTest(unittest.TestCase):
+
+    def test_batch_size(self):
+        batches = list(arrow.record_batches((make_full_entry(i) for i in range(5)), batch_size=2))
+        self.assertEqual([batch.num_rows for batch in batches], [2, 2, 1])
+
+    def test_dictionary_encoded_strings(self):
+        batch, = arrow.record_batches([make_full_entry(0), make_full_entry(1)])
+        self.assertEqual(batch.column("response_content_mime_type").dictionary.to_pylist(), ["text/html"])
+
+    def test_round_trip(self):
+        entries = [make_full_entry(i) for i in range(3)] + [Entry(request=Request(method="GET", url="http://x/"))]
+        self.assertEqual(list(arrow.read_entries(arrow.record_batches(entries))), entries)
+
+    def test_utc_offsets(self):
+        offset = timezone(timedelta(hours=5))
+        entries = [Entry(started_date_time=datetime(2017, 1, 1, 12, 30),
+                         request=Request(method="GET", url="http://x/")),
+                   Entry(started_date_time=datetime(2017, 1, 1, 12, 30, tzinfo=offset),
+                         request=Request(method="GET", url="http://x/",
+                                         cookies=[Cookie(name="a", value="b",
+                                                         expires=datetime(2018, 1, 1, tzinfo=offset))]))]
+
+        naive, aware = arrow.read_entries(arrow.record_batches(entries))
+        self.assertIsNone(naive.started_date_time.tzinfo)
+        self.assertEqual(naive.started_date_time, datetime(2017, 1, 1, 12, 30))
+        self.assertEqual(aware.started_date_time.utcoffset(), timedelta(hours=5))
+        self.assertEqual(aware.started_date_time.hour, 12)
+        self.assertEqual(aware.request.cookies[0].expires.utcoffset(), timedelta(hours=5))
+        self.assertEqual([naive, aware], entries)
+
+    def test_without_body(self):
+        batch, = arrow.record_batches([make_full_entry(0)], include_body=False)
+
+        self.assertNotIn(arrow.BODY_COLUMN, batch.schema.names)
+        entry, = arrow.read_entries([batch])
+        self.assertEqual(entry.response.content.text, "")
+        self.assertEqual(entry.response.content.size, 5)
+
+    def test_parquet_round_trip(self):
+        entries = [make_full_entry(i) for i in range(10)]
+        out = io.BytesIO()
+        arrow.write_parquet(entries, out, batch_size=4)
+
+        out.seek(0)
+        self.assertEqual(list(arrow.read_parquet(out, batch_size=3)), entries)
+
+        out.seek(0)
+        self.assertEqual([entry.response.content.text for entry in arrow.read_parquet(out, include_body=False)],
+                         [""] * 10)
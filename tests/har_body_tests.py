@@ -0,0 +1,144 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import base64
+import gzip
+import unittest
+import zlib
+
+from marshmallow_har.body import BodyCache, body_cache
+from marshmallow_har.model import Content, Header, Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def base64_content(data, mime_type="text/html"):
+    return Content(size=len(data), mime_type=mime_type, text=base64.b64encode(data).decode("ascii"),
+                   encoding="base64")
+
+
+class ContentBodyTest(unittest.TestCase):
+
+    def setUp(self):
+        body_cache.clear()
+
+    def test_plain_text(self):
+        content = Content(text="héllo")
+        self.assertEqual(content.bytes(), "héllo".encode("utf-8"))
+        self.assertEqual(content.decoded_text(), "héllo")
+
+    def test_base64(self):
+        content = base64_content(b"\x00\x01binary", mime_type="application/octet-stream")
+        self.assertEqual(content.bytes(), b"\x00\x01binary")
+
+    def test_gzip(self):
+        content = base64_content(gzip.compress("café".encode("latin-1")),
+                                 mime_type="text/plain; charset=ISO-8859-1")
+        self.assertEqual(content.decoded_text("gzip"), "café")
+
+    def test_unknown_charset_falls_back_to_utf8(self):
+        content = base64_content("héllo".encode("utf-8"), mime_type="text/plain; charset=x-unknown")
+        self.assertEqual(content.decoded_text(), "héllo")
+
+    def test_deflate_with_and_without_zlib_header(self):
+        raw = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        raw_data = raw.compress(b"hello") + raw.flush()
+
+        self.assertEqual(base64_content(zlib.compress(b"hello")).bytes("deflate"), b"hello")
+        self.assertEqual(base64_content(raw_data).bytes("deflate"), b"hello")
+
+    def test_chained_encodings(self):
+        content = base64_content(gzip.compress(zlib.compress(b"hello")))
+        self.assertEqual(content.bytes("deflate, gzip"), b"hello")
+
+    @unittest.skipIf(brotli is None, "brotli is not installed")
+    def test_brotli(self):
+        self.assertEqual(base64_content(brotli.compress(b"hello")).bytes("br"), b"hello")
+
+    def test_unsupported_encoding(self):
+        with self.assertRaises(ValueError):
+            Content(text="x").bytes("compress")
+
+    def test_streaming(self):
+        data = bytes(range(256)) * 100
+        content = base64_content(gzip.compress(data))
+
+        chunks = list(content.iter_bytes("gzip", chunk_size=64))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), data)
+
+    def test_cached_until_text_changes(self):
+        content = base64_content(b"first")
+        self.assertIs(content.bytes(), content.bytes())
+
+        content.text = base64.b64encode(b"second").decode("ascii")
+        self.assertEqual(content.bytes(), b"second")
+
+    def test_set_bytes_picks_encoding(self):
+        content = Content()
+
+        content.set_bytes(b"plain text", mime_type="text/plain")
+        self.assertEqual((content.text, content.encoding, content.size), ("plain text", None, 10))
+
+        content.set_bytes(b"\xff\xfe")
+        self.assertEqual((content.text, content.encoding, content.size), ("//4=", "base64", 2))
+        self.assertEqual(content.dump()["encoding"], "base64")
+        self.assertEqual(content.bytes(), b"\xff\xfe")
+
+    def test_response_content_encoding(self):
+        response = Response(status=200, status_text="OK",
+                            headers=[Header(name="content-encoding", value="gzip")])
+        self.assertEqual(response.content_encoding, "gzip")
+        self.assertIsNone(Response(status=200, status_text="OK").content_encoding)
+
+
+class BodyCacheTest(unittest.TestCase):
+
+    def test_size_bound(self):
+        cache = BodyCache(max_bytes=12)
+        contents = [Content(text=str(i)) for i in range(3)]
+
+        for content in contents:
+            cache.put(content, None, b"x" * 4)
+
+        self.assertEqual(cache.size, 10)
+        self.assertIsNone(cache.get(contents[0], None))
+        self.assertEqual(cache.get(contents[2], None), b"xxxx")
+
+    def test_source_text_counts_toward_size(self):
+        cache = BodyCache(max_bytes=100)
+        content = base64_content(b"x" * 30)
+        cache.put(content, None, content.bytes())
+
+        self.assertEqual(cache.size, 70)
+
+    def test_oversized_bodies_are_not_cached(self):
+        cache = BodyCache(max_bytes=5)
+        content = Content(text="abc")
+        cache.put(content, None, b"abc")
+
+        self.assertIsNone(cache.get(content, None))
+        self.assertEqual(cache.size, 0)
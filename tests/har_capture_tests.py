@@ -0,0 +1,119 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+import threading
+import unittest
+
+from marshmallow_har.capture import CaptureLog, entry_size
+from marshmallow_har.model import Content, Entry, HAR, PostData
+from marshmallow_har.schema import HARSchema
+from marshmallow_har.stream import HARWriter
+
+from factories import make_entries, make_entry
+
+
+class CaptureLogTest(unittest.TestCase):
+
+    def test_entry_size(self):
+        entry = make_entry(response={"content": Content(text="abcd")})
+        entry.request.post_data = PostData(text="xy")
+        self.assertEqual(entry_size(entry), 6)
+        entry.request.post_data.text = "é"
+        self.assertEqual(entry_size(entry), 6)
+        self.assertEqual(entry_size(Entry()), 0)
+
+    def test_max_entries(self):
+        log = CaptureLog(max_entries=3)
+        log.extend(make_entries(5))
+
+        self.assertEqual([e.request.url for e in log.snapshot().entries],
+                         ["http://example.com/%d" % i for i in (2, 3, 4)])
+        self.assertEqual(log.evicted, 2)
+
+    def test_max_bytes(self):
+        log = CaptureLog(max_bytes=10)
+        for _ in range(4):
+            log.append(make_entry(response={"content": Content(text="x" * 4)}))
+
+        self.assertEqual(len(log), 2)
+        self.assertEqual(log.size, 8)
+
+    def test_spill_evicted_entries(self):
+        out = io.StringIO()
+        with HARWriter(out, version="1.2") as writer:
+            log = CaptureLog(max_entries=2, spill=writer, version="1.2")
+            log.extend(make_entries(5))
+
+        spilled = HARSchema().load(json.loads(out.getvalue()))
+        self.assertEqual(spilled.log.entries + log.snapshot().entries, make_entries(5))
+
+    def test_failed_spill_is_retried(self):
+        class FlakyWriter:
+            def __init__(self):
+                self.entries = []
+                self.fail = True
+
+            def write(self, entry):
+                if self.fail:
+                    self.fail = False
+                    raise OSError()
+                self.entries.append(entry)
+
+        writer = FlakyWriter()
+        log = CaptureLog(max_entries=1, spill=writer)
+        entries = make_entries(3)
+
+        log.append(entries[0])
+        with self.assertRaises(OSError):
+            log.append(entries[1])
+        log.append(entries[2])
+
+        self.assertEqual(writer.entries, entries[:2])
+        self.assertEqual(log.snapshot().entries, entries[2:])
+
+    def test_dump(self):
+        log = CaptureLog(max_entries=1, version="1.2")
+        entries = make_entries(2)
+        log.extend(entries)
+
+        self.assertEqual(log.dump(), HARSchema().dump(HAR(version="1.2", entries=entries[1:])))
+
+    def test_concurrent_appends(self):
+        log = CaptureLog(max_entries=50)
+        entries = make_entries(400)
+
+        def worker(offset):
+            for entry in entries[offset::4]:
+                log.append(entry)
+                log.snapshot()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(log), 50)
+        self.assertEqual(log.evicted, 350)
@@ -0,0 +1,114 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+import unittest
+
+from marshmallow_har.diff import ADDED, CHANGED, REMOVED, FieldChange, diff_entries, diff_files, diff_logs
+from marshmallow_har.model import Content, HAR, Header, Log, Timings
+from marshmallow_har.schema import HARSchema
+
+from factories import make_entry as base_entry
+
+
+def make_entry(url, status=200, size=10, wait=5, headers=None):
+    return base_entry(url, status=status,
+                      response={"headers": headers or [], "content": Content(size=size)},
+                      timings=Timings(wait=wait))
+
+
+class DiffTest(unittest.TestCase):
+
+    def test_identical_logs(self):
+        entries = [make_entry("http://example.com/%d" % i) for i in range(5)]
+        self.assertEqual(diff_logs(Log(entries=entries), Log(entries=list(entries))), [])
+
+    def test_added_and_removed(self):
+        old = Log(entries=[make_entry("http://example.com/a"), make_entry("http://example.com/b")])
+        new = Log(entries=[make_entry("http://example.com/b"), make_entry("http://example.com/c")])
+
+        diffs = diff_logs(old, new)
+
+        self.assertEqual([(d.kind, d.url) for d in diffs], [
+            (REMOVED, "http://example.com/a"),
+            (ADDED, "http://example.com/c"),
+        ])
+
+    def test_field_changes(self):
+        old = Log(entries=[make_entry("http://example.com/", headers=[Header(name="Server", value="a")])])
+        new = Log(entries=[make_entry("http://example.com/", status=404, size=12, wait=7,
+                                      headers=[Header(name="server", value="b"),
+                                               Header(name="X-Cache", value="HIT")])])
+
+        diff, = diff_logs(old, new)
+
+        self.assertEqual(diff.kind, CHANGED)
+        self.assertEqual(diff.changes, [
+            FieldChange("response.status", 200, 404),
+            FieldChange("response.headers.server", ["a"], ["b"]),
+            FieldChange("response.headers.x-cache", None, ["HIT"]),
+            FieldChange("response.content.size", 10, 12),
+            FieldChange("timings.wait", 5, 7),
+        ])
+
+    def test_header_without_value(self):
+        headers = [Header(name="X-A", value=None), Header(name="X-A", value="1")]
+        old = Log(entries=[make_entry("http://example.com/", headers=headers)])
+        new = Log(entries=[make_entry("http://example.com/", headers=headers[:1])])
+
+        diff, = diff_logs(old, new)
+        self.assertEqual(diff.changes, [FieldChange("response.headers.x-a", [None, "1"], [None])])
+
+    def test_repeated_urls_align_by_ordinal(self):
+        old = Log(entries=[make_entry("http://example.com/", status=200),
+                           make_entry("http://example.com/", status=304)])
+        new = Log(entries=[make_entry("http://example.com/", status=200),
+                           make_entry("http://example.com/", status=200)])
+
+        diff, = diff_logs(old, new)
+
+        self.assertEqual((diff.method, diff.url, diff.ordinal), ("GET", "http://example.com/", 1))
+        self.assertEqual(diff.changes, [FieldChange("response.status", 304, 200)])
+
+    def test_window_bounds_pending_entries(self):
+        old = [make_entry("http://example.com/%d" % i) for i in range(10)]
+        new = list(reversed(old))
+
+        self.assertEqual(list(diff_entries(old, new)), [])
+
+        diffs = list(diff_entries(old, new, window=2))
+        self.assertTrue(diffs)
+        self.assertEqual({d.kind for d in diffs}, {ADDED, REMOVED})
+
+    def test_diff_files(self):
+        old = HAR(entries=[make_entry("http://example.com/a"), make_entry("http://example.com/b")])
+        new = HAR(entries=[make_entry("http://example.com/a", status=500)])
+
+        diffs = list(diff_files(io.StringIO(json.dumps(HARSchema().dump(old))),
+                                io.StringIO(json.dumps(HARSchema().dump(new)))))
+
+        self.assertEqual([(d.kind, d.url) for d in diffs], [
+            (CHANGED, "http://example.com/a"),
+            (REMOVED, "http://example.com/b"),
+        ])
@@ -0,0 +1,86 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+import unittest
+import unittest.mock
+from concurrent.futures import ThreadPoolExecutor
+
+from marshmallow_har.model import HAR
+from marshmallow_har.parallel import dump_chunk, dump_parallel, dumps_parallel
+from marshmallow_har.schema import HARSchema
+
+from factories import make_har
+
+
+class ParallelDumpTest(unittest.TestCase):
+
+    def test_threads_preserve_order(self):
+        har = make_har(25)
+        out = dumps_parallel(har, executor="thread", workers=3, chunk_size=4)
+
+        self.assertEqual(json.loads(out), HARSchema().dump(har))
+
+    def test_processes(self):
+        har = make_har(10)
+        out = dumps_parallel(har, executor="process", workers=2, chunk_size=3)
+
+        self.assertEqual(json.loads(out), HARSchema().dump(har))
+
+    def test_existing_executor(self):
+        har = make_har(5)
+        out = io.StringIO()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            count = dump_parallel(har, out, executor=executor, chunk_size=2)
+
+        self.assertEqual(count, 5)
+        self.assertEqual(json.loads(out.getvalue()), HARSchema().dump(har))
+
+    def test_worker_error_leaves_output_unterminated(self):
+        har = make_har(6)
+        out = io.StringIO()
+
+        def failing_dump_chunk(entries):
+            if entries[0] is har.log.entries[4]:
+                raise RuntimeError()
+            return dump_chunk(entries)
+
+        with unittest.mock.patch("marshmallow_har.parallel.dump_chunk", failing_dump_chunk):
+            with self.assertRaises(RuntimeError):
+                dump_parallel(har, out, executor="thread", workers=2, chunk_size=2)
+
+        with self.assertRaises(ValueError):
+            json.loads(out.getvalue())
+
+    def test_har_fields(self):
+        har = make_har(3)
+        har.comment = "top"
+        har.extended_arguments = {"_x": 1}
+
+        self.assertEqual(json.loads(dumps_parallel(har, chunk_size=2)), HARSchema().dump(har))
+
+    def test_empty_log(self):
+        har = HAR(version="1.2")
+        self.assertEqual(json.loads(dumps_parallel(har)), HARSchema().dump(har))
@@ -0,0 +1,152 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+import pickle
+import unittest
+
+from marshmallow_har.model import Entry, HAR, Param, PostData, PostParam, Request
+from marshmallow_har.parsing import populate_params
+from marshmallow_har.schema import HARSchema
+from marshmallow_har.stream import HARReader
+
+
+MULTIPART = (
+    "--xyz\r\n"
+    'Content-Disposition: form-data; name="user"\r\n'
+    "\r\n"
+    "anonymous\r\n"
+    "--xyz\r\n"
+    'Content-Disposition: form-data; name="upload"; filename="a.txt"\r\n'
+    "Content-Type: text/plain\r\n"
+    "\r\n"
+    "hello\r\n"
+    "--xyz--\r\n"
+)
+
+
+class ParsedRequestTest(unittest.TestCase):
+
+    def test_url_components(self):
+        request = Request(method="GET", url="https://example.com:8443/search?q=a+b&empty=&q=2")
+
+        self.assertEqual(request.parsed.url.hostname, "example.com")
+        self.assertEqual(request.parsed.url.port, 8443)
+        self.assertEqual(request.parsed.query_params, [
+            Param(name="q", value="a b"),
+            Param(name="empty", value=""),
+            Param(name="q", value="2"),
+        ])
+
+    def test_invalid_url(self):
+        request = Request(method="GET", url="http://[bad/x?a=1")
+
+        self.assertIsNone(request.parsed.url.hostname)
+        self.assertEqual(request.parsed.query_params, [])
+
+    def test_cached_until_url_changes(self):
+        request = Request(method="GET", url="http://example.com/?a=1")
+        parsed = request.parsed
+        self.assertIs(request.parsed, parsed)
+
+        request.url = "http://example.com/?a=2"
+        self.assertIsNot(request.parsed, parsed)
+        self.assertEqual(request.parsed.query_params, [Param(name="a", value="2")])
+
+    def test_form_post_params(self):
+        request = Request(method="POST", url="http://example.com/",
+                          post_data=PostData(mime_type="application/x-www-form-urlencoded; charset=utf-8",
+                                             text="a=1&b=%20x"))
+        self.assertEqual(request.parsed.post_params, [PostParam(name="a", value="1"),
+                                                      PostParam(name="b", value=" x")])
+
+        request.post_data = PostData(mime_type="text/plain", text="a=1")
+        self.assertEqual(request.parsed.post_params, [])
+
+    def test_multipart_post_params(self):
+        request = Request(method="POST", url="http://example.com/",
+                          post_data=PostData(mime_type="multipart/form-data; boundary=xyz", text=MULTIPART))
+
+        self.assertEqual(request.parsed.post_params, [
+            PostParam(name="user", value="anonymous"),
+            PostParam(name="upload", value="hello", file_name="a.txt", content_type="text/plain"),
+        ])
+
+    def test_cache_ignored_by_equality_and_pickle(self):
+        request = Request(method="GET", url="http://example.com/?a=1")
+        request.parsed.query_params
+
+        self.assertEqual(request, Request(method="GET", url="http://example.com/?a=1"))
+        self.assertNotIn("_parsed", pickle.loads(pickle.dumps(request)).__dict__)
+
+
+class PopulateParamsTest(unittest.TestCase):
+
+    def test_populate_missing_params(self):
+        entry = Entry(request=Request(method="POST", url="http://example.com/?a=1",
+                                      post_data=PostData(mime_type="application/x-www-form-urlencoded",
+                                                         text="b=2")))
+        populate_params([entry])
+
+        self.assertEqual(entry.request.query_string, [Param(name="a", value="1")])
+        self.assertEqual(entry.request.post_data.params, [PostParam(name="b", value="2")])
+
+    def test_invalid_url_on_load(self):
+        document = HARSchema().dump(HAR(entries=[Entry(request=Request(method="GET", url="http://[bad/x?a=1"))]))
+
+        request = HARSchema(context={"populate_params": True}).load(document).log.entries[0].request
+        self.assertEqual(request.query_string, [])
+
+    def test_existing_params_are_kept(self):
+        entry = Entry(request=Request(method="GET", url="http://example.com/?a=1",
+                                      query_string=[Param(name="x", value="y")]))
+        populate_params([entry])
+
+        self.assertEqual(entry.request.query_string, [Param(name="x", value="y")])
+
+    def test_schema_context_option(self):
+        document = HARSchema().dump(HAR(entries=[
+            Entry(request=Request(method="POST", url="http://example.com/?a=1",
+                                  post_data=PostData(mime_type="application/x-www-form-urlencoded",
+                                                     text="b=2"))),
+        ]))
+
+        request = HARSchema(context={"populate_params": True}).load(document).log.entries[0].request
+        self.assertEqual(request.query_string, [Param(name="a", value="1")])
+        self.assertEqual(request.post_data.params, [PostParam(name="b", value="2")])
+
+        request = HAR.load(document, context={"populate_params": True}).log.entries[0].request
+        self.assertEqual(request.query_string, [Param(name="a", value="1")])
+
+        self.assertEqual(HARSchema().load(document).log.entries[0].request.query_string, [])
+
+    def test_reader_option(self):
+        har = HAR(entries=[Entry(request=Request(method="GET", url="http://example.com/?a=1"))])
+        document = json.dumps(HARSchema().dump(har))
+
+        entry, = HARReader(io.StringIO(document), populate_params=True)
+        self.assertEqual(entry.request.query_string, [Param(name="a", value="1")])
+
+        entry, = HARReader(io.StringIO(document))
+        self.assertEqual(entry.request.query_string, [])
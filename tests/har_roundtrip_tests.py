@@ -0,0 +1,190 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+import os
+import pickle
+import time
+import unittest
+
+from marshmallow_har.capture import CaptureLog
+from marshmallow_har.generate import HARGenerator
+from marshmallow_har.model import HAR
+from marshmallow_har.parallel import dumps_parallel
+from marshmallow_har.schema import EntrySchema, HARSchema, LogSchema
+from marshmallow_har.store import SQLiteStore
+from marshmallow_har.stream import HARReader, HARWriter
+
+
+DOCUMENTS = int(os.environ.get("HAR_ROUNDTRIP_DOCUMENTS", 20))
+ENTRIES = int(os.environ.get("HAR_ROUNDTRIP_ENTRIES", 5))
+REPEATS = int(os.environ.get("HAR_ROUNDTRIP_REPEATS", 5))
+# Absolute budgets depend on the machine, only enforced when set.
+BUDGET_MS = float(os.environ.get("HAR_ROUNDTRIP_BUDGET_MS", 0)) or None
+
+# Slowest each path may be, relative to a plain HARSchema load and dump
+# measured in the same run.
+RELATIVE_BUDGETS = {
+    "model": 1.75,
+    "pickle": 1.75,
+    "stream": 2.0,
+    "parallel": 2.0,
+    "capture": 1.75,
+    "store": 2.0,
+}
+
+
+def log_kwargs(log):
+    return dict(version=log.version,
+                creator=log.creator,
+                browser=log.browser,
+                pages=log.pages,
+                comment=log.comment,
+                extended_arguments=log.extended_arguments)
+
+
+def schema_round_trip(document):
+    return HARSchema().dump(HARSchema().load(document))
+
+
+class RoundTripTest(unittest.TestCase):
+    """
+    Checks that random documents survive every load/dump path unchanged.
+
+    Each path must stay within its RELATIVE_BUDGETS multiple of the schema
+    round trip, and within BUDGET_MS per entry when HAR_ROUNDTRIP_BUDGET_MS is
+    set. Times are the best of REPEATS runs over all documents, in CPU time of
+    this process so that other load on the machine does not count.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.documents = [HARGenerator(seed).har(ENTRIES) for seed in range(DOCUMENTS)]
+        cls.baseline = cls.time_per_entry(schema_round_trip)
+
+    @classmethod
+    def time_per_entry(cls, round_trip):
+        best = None
+        for _ in range(REPEATS):
+            start = time.process_time()
+            for document in cls.documents:
+                round_trip(document)
+            elapsed = time.process_time() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        return best * 1000 / (DOCUMENTS * ENTRIES)
+
+    def check(self, round_trip, key=None, path=None):
+        self.maxDiff = None
+
+        for seed, document in enumerate(self.documents):
+            with self.subTest(seed=seed):
+                expected = document if key is None else document[key]
+                self.assertEqual(round_trip(document), expected)
+
+        per_entry = self.time_per_entry(round_trip)
+        if BUDGET_MS is not None:
+            self.assertLess(per_entry, BUDGET_MS, "%.2fms per entry exceeds the budget" % per_entry)
+
+        if path is not None:
+            ratio = per_entry / self.baseline
+            self.assertLess(ratio, RELATIVE_BUDGETS[path],
+                            "%.2fx the schema round trip exceeds the budget" % ratio)
+
+    def test_schema(self):
+        self.check(schema_round_trip)
+
+    def test_model(self):
+        self.check(lambda document: HAR.load(document).dump(), path="model")
+
+    def test_pickle(self):
+        self.check(lambda document: HARSchema().dump(pickle.loads(pickle.dumps(HARSchema().load(document)))),
+                   path="pickle")
+
+    def test_stream(self):
+        def round_trip(document):
+            reader = HARReader(io.StringIO(json.dumps(document)), chunk_size=97)
+            entries = list(reader)
+            log = LogSchema().load(reader.log_fields)
+
+            out = io.StringIO()
+            writer = HARWriter(out,
+                               har_comment=reader.fields.get("comment", ""),
+                               har_extended_arguments={k: v for k, v in reader.fields.items() if k.startswith("_")},
+                               **log_kwargs(log))
+            with writer:
+                for entry in entries:
+                    writer.write(entry)
+
+            return json.loads(out.getvalue())
+
+        self.check(round_trip, path="stream")
+
+    def test_parallel(self):
+        self.check(lambda document: json.loads(dumps_parallel(HARSchema().load(document),
+                                                              executor="thread", workers=2, chunk_size=2)),
+                   path="parallel")
+
+    # CaptureLog and SQLiteStore hold log contents only.
+
+    def test_capture(self):
+        def round_trip(document):
+            log = HARSchema().load(document).log
+            capture = CaptureLog(**log_kwargs(log))
+            capture.extend(log.entries)
+            return capture.dump()["log"]
+
+        self.check(round_trip, key="log", path="capture")
+
+    def test_store(self):
+        def round_trip(document):
+            with SQLiteStore() as store:
+                store.ingest_raw(document["log"]["entries"], batch_size=2)
+                raw = list(store.query_raw())
+                self.assertEqual(raw, document["log"]["entries"])
+                return dict(document["log"], entries=EntrySchema(many=True).dump(store.query()))
+
+        self.check(round_trip, key="log", path="store")
+
+
+class HARGeneratorTest(unittest.TestCase):
+
+    def test_deterministic_seed(self):
+        self.assertEqual(HARGenerator(42).har(3), HARGenerator(42).har(3))
+        self.assertNotEqual(HARGenerator(1).har(3), HARGenerator(2).har(3))
+
+    def test_extended_attributes(self):
+        def keys(value):
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    yield key
+                    yield from keys(item)
+            elif isinstance(value, list):
+                for item in value:
+                    yield from keys(item)
+
+        generated = set(keys([HARGenerator(seed).har(5) for seed in range(5)]))
+        self.assertTrue({"_ext0", "redirectURL", "serverIPAddress"} <= generated)
+
+        self.assertFalse([key for key in keys(HARGenerator(0, extended=False).har(5)) if key.startswith("_")])
@@ -0,0 +1,108 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+import unittest
+import unittest.mock
+from collections import Counter
+
+from marshmallow_har.model import HAR
+from marshmallow_har.sampling import reservoir_sample, stratified_sample
+from marshmallow_har.schema import EntrySchema, HARSchema
+
+from factories import make_entry
+
+
+def make_document(count):
+    har = HAR(entries=[make_entry("http://host%d.example.com/%d" % (i % 3, i),
+                                  status=404 if i % 5 == 0 else 200,
+                                  time=i)
+                       for i in range(count)])
+    return json.dumps(HARSchema().dump(har))
+
+
+class ReservoirSampleTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.document = make_document(30)
+
+    def sample(self, k, **kwargs):
+        return reservoir_sample(io.StringIO(self.document), k, **kwargs)
+
+    def test_sample_size_and_order(self):
+        times = [entry.time for entry in self.sample(5, seed=1)]
+
+        self.assertEqual(len(times), 5)
+        self.assertEqual(times, sorted(times))
+
+    def test_small_population(self):
+        self.assertEqual([entry.time for entry in self.sample(100)], list(range(30)))
+
+    def test_deterministic_seed(self):
+        self.assertEqual(self.sample(5, seed=7), self.sample(5, seed=7))
+
+    def test_uniform(self):
+        counts = Counter(entry.time for seed in range(300) for entry in self.sample(3, seed=seed))
+
+        self.assertEqual(set(counts), set(range(30)))
+        self.assertLess(max(counts.values()), 3 * 300 * 3 / 30)
+
+    def test_only_selected_entries_are_loaded(self):
+        with unittest.mock.patch.object(EntrySchema, "load", autospec=True) as load:
+            self.sample(4, seed=3)
+
+        self.assertEqual(load.call_count, 4)
+
+
+class StratifiedSampleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.document = make_document(30)
+
+    def test_by_host(self):
+        strata = stratified_sample(io.StringIO(self.document), 2, seed=1)
+
+        self.assertEqual(list(strata), ["host0.example.com", "host1.example.com", "host2.example.com"])
+        for host, stratum in strata.items():
+            self.assertEqual(stratum.population, 10)
+            self.assertEqual(len(stratum.entries), 2)
+            self.assertTrue(all(entry.request.url.startswith("http://%s/" % host) for entry in stratum.entries))
+
+    def test_invalid_url_has_no_host(self):
+        har = HAR(entries=[make_entry("http://[bad/x"), make_entry("http://example.com/")])
+        strata = stratified_sample(io.StringIO(json.dumps(HARSchema().dump(har))), 1)
+
+        self.assertEqual(list(strata), [None, "example.com"])
+
+    def test_by_status(self):
+        strata = stratified_sample(io.StringIO(self.document), 10, by="status", seed=1)
+
+        self.assertEqual(strata[404].population, 6)
+        self.assertEqual(len(strata[404].entries), 6)
+        self.assertEqual(len(strata[200].entries), 10)
+
+    def test_by_callable(self):
+        strata = stratified_sample(io.StringIO(self.document), 1, by=lambda raw: raw["time"] % 2, seed=1)
+        self.assertEqual(sorted(strata), [0, 1])
@@ -0,0 +1,107 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from marshmallow_har.model import HAR
+from marshmallow_har.schema import HARSchema
+from marshmallow_har.store import SQLiteStore
+
+from factories import make_full_entry
+
+
+def make_entry(i, host="example.com", status=200):
+    entry = make_full_entry(i, host=host, status=status)
+    entry.extended_arguments = {"_priority": "High"}
+    entry.request.query_string[0].extended_arguments = {"_decoded": True}
+    entry.response.headers[0].comment = "type"
+    return entry
+
+
+class SQLiteStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = SQLiteStore()
+        self.entries = [make_entry(0), make_entry(1), make_entry(2, host="other.com", status=404)]
+        self.store.ingest(self.entries, batch_size=2)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_round_trip(self):
+        self.assertEqual(list(self.store.query()), self.entries)
+
+    def test_filters(self):
+        self.assertEqual(self.store.count(), 3)
+        self.assertEqual(self.store.count(host="example.com"), 2)
+        self.assertEqual(self.store.count(status=404), 1)
+        self.assertEqual([e.request.url for e in self.store.query(method="POST")], ["http://example.com/1?i=1"])
+        self.assertEqual(self.store.count(since=datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc)), 2)
+        self.assertEqual(len(list(self.store.query(limit=1))), 1)
+
+    def test_time_filters_compare_in_utc(self):
+        store = SQLiteStore()
+        entry = make_entry(0)
+        entry.started_date_time = datetime(2020, 1, 1, 3, 0, tzinfo=timezone(timedelta(hours=5)))
+        store.ingest([entry])
+
+        self.assertEqual(store.count(since="2020-01-01T00:00:00Z"), 0)
+        self.assertEqual(store.count(until="2020-01-01T00:00:00+00:00"), 1)
+        self.assertEqual(store.count(since=datetime(2019, 12, 31, 22, 0, tzinfo=timezone.utc)), 1)
+        self.assertEqual(store.count(until=datetime(2019, 12, 31, 22, 0)), 0)
+        store.close()
+
+    def test_invalid_url(self):
+        entry = make_entry(3)
+        entry.request.url = "http://[bad/x"
+        self.store.ingest([entry])
+
+        self.assertEqual(self.store.count(), 4)
+        self.assertEqual(self.store.count(host="example.com"), 2)
+
+    def test_unknown_filter(self):
+        with self.assertRaises(TypeError):
+            self.store.count(color="blue")
+
+    def test_normalized_tables(self):
+        rows = self.store.connection.execute(
+            "SELECT COUNT(*) FROM headers WHERE source = 'request' AND name = 'Host'").fetchone()
+        self.assertEqual(rows, (3,))
+
+        body, = self.store.connection.execute(
+            "SELECT text FROM bodies WHERE source = 'request' ORDER BY entry_id LIMIT 1").fetchone()
+        self.assertEqual(body, "body 0")
+
+    def test_ingest_file_and_export(self):
+        har = HAR(version="1.2", entries=self.entries)
+        self.store.ingest_file(io.StringIO(json.dumps(HARSchema().dump(har))))
+        self.assertEqual(self.store.count(), 6)
+
+        out = io.StringIO()
+        self.store.export(out, self.store.query(status=404), version="1.2")
+
+        self.assertEqual(json.loads(out.getvalue()),
+                         HARSchema().dump(HAR(version="1.2", entries=[self.entries[2]] * 2)))
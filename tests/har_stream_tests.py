@@ -0,0 +1,100 @@
+# MIT License
+#
+# Copyright (c) 2017- Delve Labs Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import io
+import json
+import unittest
+
+from marshmallow_har.model import HAR
+from marshmallow_har.schema import HARSchema
+from marshmallow_har.stream import HARReader, HARWriter
+
+from factories import make_har
+
+
+class HARReaderTest(unittest.TestCase):
+
+    def test_read_entries_with_small_chunks(self):
+        har = make_har(20)
+        reader = HARReader(io.StringIO(json.dumps(HARSchema().dump(har), indent=2)), chunk_size=7)
+
+        self.assertEqual(list(reader), har.log.entries)
+        self.assertEqual(reader.log_fields["version"], "1.2")
+        self.assertEqual(reader.log_fields["pages"][0]["id"], "page_0")
+
+    def test_fields_after_entries(self):
+        document = '{"log": {"entries": [{"time": 12345}], "version": "1.2"}, "comment": "x"}'
+        reader = HARReader(io.StringIO(document), chunk_size=3)
+
+        self.assertEqual([12345], [entry.time for entry in reader])
+        self.assertEqual(reader.log_fields, {"version": "1.2"})
+        self.assertEqual(reader.fields, {"comment": "x"})
+
+    def test_empty_entries(self):
+        reader = HARReader(io.StringIO('{"log": {"entries": []}}'))
+        self.assertEqual(list(reader), [])
+
+    def test_truncated_document(self):
+        reader = HARReader(io.StringIO('{"log": {"entries": [{"time": 1}, {"ti'), chunk_size=4)
+        with self.assertRaises(ValueError):
+            list(reader)
+
+
+class HARWriterTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        har = make_har(3)
+        out = io.StringIO()
+
+        with HARWriter(out, version="1.2", creator=har.log.creator, pages=har.log.pages) as writer:
+            for entry in har.log.entries:
+                writer.write(entry)
+
+        self.assertEqual(json.loads(out.getvalue()), HARSchema().dump(har))
+
+    def test_exception_leaves_document_unterminated(self):
+        out = io.StringIO()
+        with self.assertRaises(RuntimeError):
+            with HARWriter(out, version="1.2") as writer:
+                writer.write(make_har(1).log.entries[0])
+                raise RuntimeError()
+
+        self.assertTrue(writer.failed)
+        with self.assertRaises(ValueError):
+            json.loads(out.getvalue())
+        with self.assertRaises(ValueError):
+            writer.write(make_har(1).log.entries[0])
+
+    def test_har_fields(self):
+        out = io.StringIO()
+        HARWriter(out, version="1.2", har_comment="top", har_extended_arguments={"_x": 1}).close()
+
+        self.assertEqual(json.loads(out.getvalue()),
+                         HARSchema().dump(HAR(log=HAR(version="1.2").log, comment="top",
+                                              extended_arguments={"_x": 1})))
+
+    def test_empty_document(self):
+        out = io.StringIO()
+        HARWriter(out, version="1.2").close()
+
+        self.assertEqual(json.loads(out.getvalue()), HARSchema().dump(HAR(version="1.2")))